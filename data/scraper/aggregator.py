@@ -6,51 +6,146 @@ Produces:
 - Grid-square aggregation: median $/sqft per rectangular grid cell
 """
 
-import json
 import logging
 import math
-from collections import defaultdict
+from pathlib import Path
 from typing import Any
 
 from config import (
     AGGREGATES_DIR,
     ASHLAND_CENTER_LAT,
     ASHLAND_CENTER_LNG,
+    SALES_ENCODER,
 )
 
 logger = logging.getLogger(__name__)
 
+# Parcel metrics that get their own hexbin/grid aggregation files
+METRICS = ["price_per_sqft", "price_per_sqft_lot", "last_sale_price", "assessed_value"]
+
+
+# ── Shared helpers ─────────────────────────────────────────────────────────
+
+def _locate_parcels(
+    parcels: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[float], list[float]]:
+    """Return the parcels that have coordinates, plus their lat and lng columns."""
+    located: list[dict[str, Any]] = []
+    lats: list[float] = []
+    lngs: list[float] = []
+    for parcel in parcels:
+        lat = parcel.get("lat")
+        lng = parcel.get("lng")
+        if lat is None or lng is None:
+            continue
+        located.append(parcel)
+        lats.append(lat)
+        lngs.append(lng)
+    return located, lats, lngs
+
+
+# Cell keys pack a pair of signed coordinates (a, b) into one int as
+# (a << 32) | (b & 0xFFFFFFFF), which hashes faster than a tuple key.
+
+def _unpack_cell(key: int) -> tuple[int, int]:
+    """Split a packed cell key back into its (a, b) coordinates."""
+    a = key >> 32
+    b = key & 0xFFFFFFFF
+    if b & 0x80000000:
+        b -= 0x100000000
+    return a, b
+
+
+# Running per-cell stats: [count, total, min, max, values]. Count, mean, min
+# and max are folded in as values arrive; the values list is kept only so
+# the median can be taken at the end.
+
+def _add_to_cell(cells: dict[int, list[Any]], key: int, value: float) -> None:
+    """Fold one metric value into the running stats of its cell."""
+    cell = cells.get(key)
+    if cell is None:
+        cells[key] = [1, value, value, value, [value]]
+        return
+    cell[0] += 1
+    cell[1] += value
+    if value < cell[2]:
+        cell[2] = value
+    if value >= cell[3]:
+        cell[3] = value
+    cell[4].append(value)
+
+
+def _group_by_cell(
+    keys: list[int],
+    values: list[float | None],
+) -> dict[int, list[Any]]:
+    """Group metric values by packed cell key, skipping parcels without a value."""
+    cells: dict[int, list[Any]] = {}
+    for key, value in zip(keys, values):
+        if value is not None:
+            _add_to_cell(cells, key, value)
+    return cells
+
+
+def _summarize(cell: list[Any]) -> dict[str, Any]:
+    """
+    Return count, median, mean, min and max for one cell.
+
+    The median is the upper median (sorted(values)[n // 2]). Single-parcel
+    cells are common at this cell size and skip the sort entirely.
+    """
+    n, total, low, high, values = cell
+    median = values[0] if n == 1 else sorted(values)[n // 2]
+
+    return {
+        "count": n,
+        "median": median,
+        "mean": round(total / n, 2),
+        "min": low,
+        "max": high,
+    }
+
+
 # ── Hexbin (flat-top hex grid) ─────────────────────────────────────────────
 
 # Hex cell size in degrees (roughly 100m at Ashland's latitude)
 HEX_SIZE_DEG = 0.001
 
+# Constant factors of the hex math, computed once instead of per cell
+_SQRT3 = math.sqrt(3)
+_CENTER_LNG_SCALE = math.cos(math.radians(ASHLAND_CENTER_LAT))
 
-def _hex_coords(lat: float, lng: float, size: float = HEX_SIZE_DEG) -> tuple[int, int]:
-    """
-    Convert lat/lng to axial hex coordinates (q, r) on a flat-top hex grid.
 
-    This is a simplified hex binning using offset coordinates.
+def _hex_cells(
+    lats: list[float],
+    lngs: list[float],
+    size: float = HEX_SIZE_DEG,
+) -> list[int]:
     """
-    # Adjust for longitude compression at this latitude
-    lng_scale = math.cos(math.radians(lat))
+    Bin a whole column of lat/lng points into packed hex cell keys in one pass.
 
-    q = int(round(lng / (size * 1.5)))
-    r_offset = 0.5 * (q % 2)
-    r = int(round((lat / (size * math.sqrt(3) / lng_scale)) - r_offset))
+    Each point maps to axial hex coordinates (q, r) on a flat-top hex grid,
+    adjusted for longitude compression at its latitude, packed into one int.
+    """
+    cos, radians = math.cos, math.radians
+    step_lng = size * 1.5
+    step_lat = size * _SQRT3
 
-    return q, r
+    cells: list[int] = []
+    for lat, lng in zip(lats, lngs):
+        q = int(round(lng / step_lng))
+        r = int(round((lat / (step_lat / cos(radians(lat)))) - 0.5 * (q & 1)))
+        cells.append((q << 32) | (r & 0xFFFFFFFF))
+    return cells
 
 
 def _hex_center(q: int, r: int, size: float = HEX_SIZE_DEG) -> tuple[float, float]:
-    """Convert axial hex coordinates back to lat/lng center point."""
-    lng_scale = math.cos(math.radians(ASHLAND_CENTER_LAT))
-
+    """Convert axial hex coordinates back to an unrounded lat/lng center point."""
     lng = q * size * 1.5
-    r_offset = 0.5 * (q % 2)
-    lat = (r + r_offset) * (size * math.sqrt(3) / lng_scale)
+    r_offset = 0.5 * (q & 1)
+    lat = (r + r_offset) * (size * _SQRT3 / _CENTER_LNG_SCALE)
 
-    return round(lat, 6), round(lng, 6)
+    return lat, lng
 
 
 def compute_hexbin_aggregation(
@@ -66,43 +161,31 @@ def compute_hexbin_aggregation(
     - count (number of parcels in cell)
     - median, mean, min, max of the metric
     """
-    # Group parcels by hex cell
-    cells: dict[tuple[int, int], list[float]] = defaultdict(list)
-
-    for parcel in parcels:
-        lat = parcel.get("lat")
-        lng = parcel.get("lng")
-        value = parcel.get(metric)
-
-        if lat is None or lng is None or value is None:
-            continue
+    located, lats, lngs = _locate_parcels(parcels)
+    cells = _group_by_cell(_hex_cells(lats, lngs), [p.get(metric) for p in located])
+    return _hexbin_stats(cells, len(parcels))
 
-        q, r = _hex_coords(lat, lng)
-        cells[(q, r)].append(value)
 
+def _hexbin_stats(
+    cells: dict[int, list[Any]],
+    parcel_count: int,
+) -> list[dict[str, Any]]:
+    """Summarize grouped hex cell values into output records."""
     # Compute statistics per cell
     hex_data: list[dict[str, Any]] = []
-    for (q, r), values in cells.items():
-        if not values:
-            continue
-
-        values_sorted = sorted(values)
-        n = len(values_sorted)
+    for key, cell in cells.items():
+        q, r = _unpack_cell(key)
         center_lat, center_lng = _hex_center(q, r)
 
         hex_data.append({
             "q": q,
             "r": r,
-            "lat": center_lat,
-            "lng": center_lng,
-            "count": n,
-            "median": values_sorted[n // 2],
-            "mean": round(sum(values) / n, 2),
-            "min": values_sorted[0],
-            "max": values_sorted[-1],
+            "lat": round(center_lat, 6),
+            "lng": round(center_lng, 6),
+            **_summarize(cell),
         })
 
-    logger.info("Hexbin aggregation: %d cells from %d parcels", len(hex_data), len(parcels))
+    logger.info("Hexbin aggregation: %d cells from %d parcels", len(hex_data), parcel_count)
     return hex_data
 
 
@@ -112,18 +195,24 @@ def compute_hexbin_aggregation(
 GRID_SIZE_DEG = 0.001
 
 
-def _grid_coords(lat: float, lng: float, size: float = GRID_SIZE_DEG) -> tuple[int, int]:
-    """Convert lat/lng to grid row/col."""
-    col = int(math.floor(lng / size))
-    row = int(math.floor(lat / size))
-    return row, col
+def _grid_cells(
+    lats: list[float],
+    lngs: list[float],
+    size: float = GRID_SIZE_DEG,
+) -> list[int]:
+    """Bin a whole column of lat/lng points into packed grid cell keys in one pass."""
+    floor = math.floor
+    return [
+        (int(floor(lat / size)) << 32) | (int(floor(lng / size)) & 0xFFFFFFFF)
+        for lat, lng in zip(lats, lngs)
+    ]
 
 
 def _grid_center(row: int, col: int, size: float = GRID_SIZE_DEG) -> tuple[float, float]:
-    """Convert grid row/col to center lat/lng."""
+    """Convert grid row/col to an unrounded center lat/lng."""
     lat = (row + 0.5) * size
     lng = (col + 0.5) * size
-    return round(lat, 6), round(lng, 6)
+    return lat, lng
 
 
 def compute_grid_aggregation(
@@ -135,83 +224,92 @@ def compute_grid_aggregation(
 
     Returns list of grid cells with statistics.
     """
-    cells: dict[tuple[int, int], list[float]] = defaultdict(list)
+    located, lats, lngs = _locate_parcels(parcels)
+    cells = _group_by_cell(_grid_cells(lats, lngs), [p.get(metric) for p in located])
+    return _grid_stats(cells, len(parcels))
 
-    for parcel in parcels:
-        lat = parcel.get("lat")
-        lng = parcel.get("lng")
-        value = parcel.get(metric)
-
-        if lat is None or lng is None or value is None:
-            continue
-
-        row, col = _grid_coords(lat, lng)
-        cells[(row, col)].append(value)
 
+def _grid_stats(
+    cells: dict[int, list[Any]],
+    parcel_count: int,
+) -> list[dict[str, Any]]:
+    """Summarize grouped grid cell values into output records."""
     grid_data: list[dict[str, Any]] = []
-    for (row, col), values in cells.items():
-        if not values:
-            continue
-
-        values_sorted = sorted(values)
-        n = len(values_sorted)
+    for key, cell in cells.items():
+        row, col = _unpack_cell(key)
         center_lat, center_lng = _grid_center(row, col)
 
         grid_data.append({
             "row": row,
             "col": col,
-            "lat": center_lat,
-            "lng": center_lng,
-            "count": n,
-            "median": values_sorted[n // 2],
-            "mean": round(sum(values) / n, 2),
-            "min": values_sorted[0],
-            "max": values_sorted[-1],
+            "lat": round(center_lat, 6),
+            "lng": round(center_lng, 6),
+            **_summarize(cell),
         })
 
-    logger.info("Grid aggregation: %d cells from %d parcels", len(grid_data), len(parcels))
+    logger.info("Grid aggregation: %d cells from %d parcels", len(grid_data), parcel_count)
     return grid_data
 
 
 # ── Write aggregation files ───────────────────────────────────────────────
 
+def _write_json(path: Path, payload: dict[str, Any]) -> None:
+    """Write an aggregation payload as compact JSON (no indentation).
+
+    The document is encoded in memory and written with a single call rather
+    than streamed through many small buffered writes.
+    """
+    path.write_text(SALES_ENCODER.encode(payload), encoding="utf-8")
+
+
 def write_aggregations(parcels: list[dict[str, Any]]) -> None:
-    """Compute and write all aggregation files."""
-    AGGREGATES_DIR.mkdir(parents=True, exist_ok=True)
+    """Compute and write all aggregation files.
 
-    metrics = ["price_per_sqft", "price_per_sqft_lot", "last_sale_price", "assessed_value"]
+    Every parcel is binned once and its metrics are grouped into the hex and
+    grid cells for all metrics in the same pass.
+    """
+    AGGREGATES_DIR.mkdir(parents=True, exist_ok=True)
 
-    for metric in metrics:
-        # Check if any parcels have this metric
-        has_data = any(p.get(metric) is not None for p in parcels)
-        if not has_data:
+    located, lats, lngs = _locate_parcels(parcels)
+    hex_keys = _hex_cells(lats, lngs)
+    grid_keys = _grid_cells(lats, lngs)
+
+    hex_groups: dict[str, dict[int, list[Any]]] = {metric: {} for metric in METRICS}
+    grid_groups: dict[str, dict[int, list[Any]]] = {metric: {} for metric in METRICS}
+    targets = [(metric, hex_groups[metric], grid_groups[metric]) for metric in METRICS]
+    for parcel, hex_key, grid_key in zip(located, hex_keys, grid_keys):
+        for metric, metric_hex, metric_grid in targets:
+            value = parcel.get(metric)
+            if value is None:
+                continue
+            _add_to_cell(metric_hex, hex_key, value)
+            _add_to_cell(metric_grid, grid_key, value)
+
+    for metric in METRICS:
+        if not hex_groups[metric]:
             logger.info("No data for metric %s, skipping", metric)
             continue
 
         # Hexbin
-        hex_data = compute_hexbin_aggregation(parcels, metric)
-        if hex_data:
-            outpath = AGGREGATES_DIR / f"hexbin-{metric}.json"
-            with open(outpath, "w") as f:
-                json.dump({
-                    "metric": metric,
-                    "aggregation": "hexbin",
-                    "hex_size_deg": HEX_SIZE_DEG,
-                    "cell_count": len(hex_data),
-                    "cells": hex_data,
-                }, f, indent=2)
-            logger.info("Wrote %s", outpath)
+        hex_data = _hexbin_stats(hex_groups[metric], len(parcels))
+        outpath = AGGREGATES_DIR / f"hexbin-{metric}.json"
+        _write_json(outpath, {
+            "metric": metric,
+            "aggregation": "hexbin",
+            "hex_size_deg": HEX_SIZE_DEG,
+            "cell_count": len(hex_data),
+            "cells": hex_data,
+        })
+        logger.info("Wrote %s", outpath)
 
         # Grid
-        grid_data = compute_grid_aggregation(parcels, metric)
-        if grid_data:
-            outpath = AGGREGATES_DIR / f"grid-{metric}.json"
-            with open(outpath, "w") as f:
-                json.dump({
-                    "metric": metric,
-                    "aggregation": "grid",
-                    "grid_size_deg": GRID_SIZE_DEG,
-                    "cell_count": len(grid_data),
-                    "cells": grid_data,
-                }, f, indent=2)
-            logger.info("Wrote %s", outpath)
+        grid_data = _grid_stats(grid_groups[metric], len(parcels))
+        outpath = AGGREGATES_DIR / f"grid-{metric}.json"
+        _write_json(outpath, {
+            "metric": metric,
+            "aggregation": "grid",
+            "grid_size_deg": GRID_SIZE_DEG,
+            "cell_count": len(grid_data),
+            "cells": grid_data,
+        })
+        logger.info("Wrote %s", outpath)
@@ -4,29 +4,34 @@ Batch scrape PDO detail pages and parse them into JSON incrementally.
 
 This script:
 1. Identifies accounts without existing sales detail files
-2. Scrapes Ora_asmt_details.cfm for each
+2. Scrapes Ora_asmt_details.cfm for each, a few accounts at a time, reusing
+   pages already in the PDO HTML cache
 3. Parses and writes per-account JSON immediately
-4. Updates parcels.json every SAVE_INTERVAL accounts
-5. Handles timeouts gracefully — partial progress is always saved
+4. Appends each parcel update to a JSONL journal and rewrites parcels.json
+   once at the end
+5. Handles timeouts gracefully — partial progress is always saved, and a
+   journal left by an interrupted run is replayed on the next start
 
 Usage:
-    python batch_scrape.py [--limit N] [--save-interval N]
+    python batch_scrape.py [--limit N] [--save-interval N] [--workers N]
+                           [--parse-workers N] [--no-cache]
 """
 
 import argparse
 import json
 import logging
+import multiprocessing
 import os
 import sys
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from config import DATA_DIR, PARCELS_JSON, SALES_DIR
+from config import DATA_DIR, PARCELS_JSON, SALES_DIR, SALES_ENCODER
 from parser import parse_detail
-from pdo_scraper import SESSION, PAGE_TYPES
+from pdo_scraper import fetch_page
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,106 +40,166 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-DETAIL_URL = PAGE_TYPES["detail"]
-REQUEST_DELAY = 0.75
-REQUEST_TIMEOUT = 20
-MAX_RETRIES = 2
-SAVE_INTERVAL = 50  # save parcels.json every N accounts
+MIN_DETAIL_BYTES = 200  # anything shorter is an error page, not a detail page
+SAVE_INTERVAL = 50  # flush the update journal every N accounts
+WORKERS = 4  # concurrent detail fetches; together still one request per REQUEST_DELAY_SEC
 
 
 def load_parcels() -> tuple[dict, list[dict]]:
     """Load parcels.json and return (full_data, parcels_list)."""
-    with open(PARCELS_JSON) as f:
-        data = json.load(f)
+    data = json.loads(PARCELS_JSON.read_bytes())
     return data, data["parcels"]
 
 
 def get_missing_accounts(parcels: list[dict]) -> list[str]:
-    """Find accounts that have no sales detail file yet."""
-    existing = set()
-    for fn in os.listdir(SALES_DIR):
-        if fn.endswith(".json"):
-            existing.add(fn.replace(".json", ""))
-
-    missing = []
-    for p in parcels:
-        acct = p.get("account", "")
-        if acct and acct not in existing:
-            missing.append(acct)
-    return missing
-
-
-def fetch_detail(account: str) -> str | None:
-    """Fetch Ora_asmt_details.cfm for an account. Returns HTML or None."""
-    clean = account.replace("-", "").replace(" ", "")
-    params = {"account": clean}
-
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = SESSION.get(DETAIL_URL, params=params, timeout=REQUEST_TIMEOUT)
-            resp.raise_for_status()
-            html = resp.text
-            if len(html) < 200:
-                logger.warning("Short response for %s (%d bytes)", account, len(html))
-                return None
-            return html
-        except Exception as exc:
-            wait = 2.0 * (2 ** attempt)
-            logger.warning(
-                "Error for %s (attempt %d/%d): %s — retry in %.0fs",
-                account, attempt + 1, MAX_RETRIES, exc, wait,
-            )
-            time.sleep(wait)
-
-    logger.error("All attempts failed for %s", account)
-    return None
+    """Find accounts that have no sales detail file yet, each listed once."""
+    with os.scandir(SALES_DIR) as entries:
+        existing = {
+            entry.name[:-5] for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        }
+
+    # Once per account: parcels can share one, and concurrent workers would
+    # otherwise fetch it and write its files at the same time
+    return list(dict.fromkeys(
+        acct for p in parcels
+        if (acct := p.get("account", "")) and acct not in existing
+    ))
+
+
+def fetch_detail(account: str, use_cache: bool = True) -> str | None:
+    """Return an account's detail page, or None if it could not be fetched.
+
+    Goes through pdo_scraper.fetch_page, which serves the PDO HTML cache,
+    caches what it fetches and paces network requests on the shared
+    PDO_LIMITER. Pages too short to be a real detail page count as failures.
+    """
+    html = fetch_page(account, "detail", force=not use_cache)
+    if html is not None and len(html) < MIN_DETAIL_BYTES:
+        logger.warning("Short detail page for %s (%d bytes)", account, len(html))
+        return None
+    return html
+
+
+def default_parse_workers(fetch_workers: int) -> int:
+    """Parser processes to run beside fetch_workers fetch threads.
+
+    Fetching is paced by the shared PDO rate limit, so more parsers than fetch threads
+    would sit idle. On a single CPU a worker process only adds a hop per
+    page, so pages are parsed in the fetch threads (0).
+    """
+    cpus = os.cpu_count() or 1
+    if cpus == 1:
+        return 0
+    return max(1, min(fetch_workers, cpus))
+
+
+def fetch_and_parse(
+    account: str,
+    use_cache: bool = True,
+    parse_pool: ProcessPoolExecutor | None = None,
+) -> dict | None:
+    """Fetch and parse an account's detail page. Returns parsed data or None.
+
+    With a parse_pool the parse runs in a worker process, so pages from all
+    fetch threads are parsed in parallel instead of queuing on one core.
+    """
+    html = fetch_detail(account, use_cache)
+    if not html:
+        return None
+    if parse_pool is None:
+        return parse_detail(html)
+    return parse_pool.submit(parse_detail, html).result()
+
+
+def write_detail_file(out_file: Path, detail_data: dict) -> None:
+    """Write one account's sales detail JSON (compact, no indentation)."""
+    out_file.write_text(SALES_ENCODER.encode(detail_data))
 
 
 def update_parcel(parcel: dict, parsed: dict) -> None:
     """Update a parcel record with parsed detail data."""
-    if parsed.get("sqft_living"):
-        parcel["sqft_living"] = parsed["sqft_living"]
-    if parsed.get("sqft_lot"):
-        parcel["sqft_lot"] = parsed["sqft_lot"]
-    if parsed.get("year_built"):
-        parcel["year_built"] = parsed["year_built"]
-    if parsed.get("assessed_value"):
-        parcel["assessed_value"] = parsed["assessed_value"]
-
+    fields = {
+        key: parsed[key]
+        for key in ("sqft_living", "sqft_lot", "year_built", "assessed_value")
+        if parsed.get(key)
+    }
     if parsed.get("last_sale_price"):
-        parcel["last_sale_price"] = parsed["last_sale_price"]
-        parcel["last_sale_date"] = parsed.get("last_sale_date")
-
-    parcel["num_sales"] = len(parsed.get("sales", []))
-    parcel["num_permits"] = len(parsed.get("permits", []))
+        fields["last_sale_price"] = parsed["last_sale_price"]
+        fields["last_sale_date"] = parsed.get("last_sale_date")
 
-    if parcel.get("last_sale_price") and parcel.get("sqft_living"):
-        parcel["price_per_sqft"] = round(
-            parcel["last_sale_price"] / parcel["sqft_living"], 2
-        )
+    fields["num_sales"] = len(parsed.get("sales", ()))
+    fields["num_permits"] = len(parsed.get("permits", ()))
+    parcel.update(fields)
 
-    if parcel.get("last_sale_price") and parcel.get("sqft_lot") and parcel["sqft_lot"] > 0:
-        parcel["price_per_sqft_lot"] = round(
-            parcel["last_sale_price"] / parcel["sqft_lot"], 2
-        )
+    price = parcel.get("last_sale_price")
+    sqft_living = parcel.get("sqft_living")
+    sqft_lot = parcel.get("sqft_lot")
+    if price and sqft_living:
+        parcel["price_per_sqft"] = round(price / sqft_living, 2)
+    if price and sqft_lot and sqft_lot > 0:
+        parcel["price_per_sqft_lot"] = round(price / sqft_lot, 2)
 
 
 def save_parcels(parcels: list[dict]) -> None:
-    """Write parcels.json."""
+    """Write parcels.json.
+
+    The document is encoded in memory, written in one call to a temporary
+    sibling and then moved into place, so an interrupted save never leaves a
+    truncated parcels.json behind.
+    """
     data = {
         "generated": datetime.now(timezone.utc).isoformat(),
         "count": len(parcels),
         "parcels": parcels,
     }
-    with open(PARCELS_JSON, "w") as f:
-        json.dump(data, f, indent=2)
+    tmp_path = PARCELS_JSON.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2))
+    os.replace(tmp_path, PARCELS_JSON)
+
+
+def _journal_path() -> Path:
+    """Path of the append-only parcel update journal beside parcels.json."""
+    return PARCELS_JSON.with_suffix(".updates.jsonl")
+
+
+def replay_journal(parcel_map: dict[str, dict]) -> int:
+    """Apply parcel updates journaled by an earlier, interrupted run.
+
+    Returns the number of updates applied.
+    """
+    path = _journal_path()
+    if not path.exists():
+        return 0
+
+    applied = 0
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write can leave a truncated last line
+                logger.warning("Skipping unreadable journal line in %s", path)
+                continue
+            parcel = parcel_map.get(entry.get("account"))
+            if parcel is not None:
+                parcel.update(entry["parcel"])
+                applied += 1
+    return applied
 
 
 def main():
     parser = argparse.ArgumentParser(description="Batch scrape PDO detail pages")
     parser.add_argument("--limit", type=int, default=0, help="Max accounts to scrape (0=all)")
     parser.add_argument("--save-interval", type=int, default=SAVE_INTERVAL,
-                        help="Save parcels.json every N accounts")
+                        help="Flush the parcel update journal every N accounts")
+    parser.add_argument("--workers", type=int, default=WORKERS,
+                        help="Number of detail pages to fetch concurrently")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-fetch detail pages even if they are in the HTML cache")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Processes parsing detail pages (0=parse in the fetch threads; "
+                             "default: one per fetch worker, up to the CPU count)")
     args = parser.parse_args()
 
     SALES_DIR.mkdir(parents=True, exist_ok=True)
@@ -142,6 +207,13 @@ def main():
     _, parcels = load_parcels()
     parcel_map = {p["account"]: p for p in parcels if p.get("account")}
 
+    journal_path = _journal_path()
+    recovered = replay_journal(parcel_map)
+    if recovered:
+        logger.info("Recovered %d parcel updates from an interrupted run", recovered)
+        save_parcels(parcels)
+    journal_path.unlink(missing_ok=True)
+
     missing = get_missing_accounts(parcels)
     logger.info("Found %d accounts needing scraping", len(missing))
 
@@ -155,60 +227,90 @@ def main():
     new_sales = 0
     new_sqft = 0
 
-    for i, acct in enumerate(missing):
-        html = fetch_detail(acct)
-        time.sleep(REQUEST_DELAY)
-
-        if not html:
-            errors += 1
-            if errors > 20 and errors > scraped:
-                logger.error("Too many errors (%d), stopping early", errors)
-                break
-            continue
-
-        # Parse the HTML
-        parsed = parse_detail(html)
-
-        # Write per-account JSON
-        detail_data = {
-            "account": acct,
-            "maptaxlot": parcel_map.get(acct, {}).get("maptaxlot", ""),
-            "sales": [],
-            "permits": [],
-            "improvements": parsed.get("improvements", []),
-        }
-        out_file = SALES_DIR / f"{acct}.json"
-        with open(out_file, "w") as f:
-            json.dump(detail_data, f, indent=2)
-
-        # Update the parcel record in memory
-        if acct in parcel_map:
-            update_parcel(parcel_map[acct], parsed)
-
-        scraped += 1
-        if parsed.get("last_sale_price"):
-            new_sales += 1
-        if parsed.get("sqft_living"):
-            new_sqft += 1
-
-        if (i + 1) % 25 == 0:
-            logger.info(
-                "Progress: %d/%d (%.1f%%) — %d scraped, %d errors, "
-                "+%d sales, +%d sqft",
-                i + 1, total, 100 * (i + 1) / total,
-                scraped, errors, new_sales, new_sqft,
-            )
-
-        # Periodic save
-        if scraped > 0 and scraped % args.save_interval == 0:
-            logger.info("Saving parcels.json (checkpoint at %d scraped)...", scraped)
-            save_parcels(parcels)
+    parse_workers = args.parse_workers
+    if parse_workers is None:
+        parse_workers = default_parse_workers(args.workers)
+    # Created before the fetch threads, with forkserver rather than fork so
+    # workers never inherit locks held by other threads (logging, urllib3)
+    parse_pool = (
+        ProcessPoolExecutor(max_workers=parse_workers,
+                            mp_context=multiprocessing.get_context("forkserver"))
+        if parse_workers > 0 else None
+    )
+    pool = ThreadPoolExecutor(max_workers=max(1, args.workers))
+    futures = {
+        pool.submit(fetch_and_parse, acct, not args.no_cache, parse_pool): acct
+        for acct in missing
+    }
+    # A single writer thread owns the per-account files so disk stalls never
+    # hold up handing fetched pages to the parser
+    writer = ThreadPoolExecutor(max_workers=1)
+    writes = []
+    journal = open(journal_path, "a")
+
+    try:
+        for i, future in enumerate(as_completed(futures)):
+            acct = futures[future]
+            parsed = future.result()
+
+            if parsed is None:
+                errors += 1
+                if errors > 20 and errors > scraped:
+                    logger.error("Too many errors (%d), stopping early", errors)
+                    break
+                continue
+
+            # Write per-account JSON
+            detail_data = {
+                "account": acct,
+                "maptaxlot": parcel_map.get(acct, {}).get("maptaxlot", ""),
+                "sales": [],
+                "permits": [],
+                "improvements": parsed.get("improvements", []),
+            }
+            out_file = SALES_DIR / f"{acct}.json"
+            writes.append(writer.submit(write_detail_file, out_file, detail_data))
+
+            # Update the parcel record in memory and journal it
+            if acct in parcel_map:
+                update_parcel(parcel_map[acct], parsed)
+                journal.write(json.dumps({"account": acct, "parcel": parcel_map[acct]}) + "\n")
+
+            scraped += 1
+            if parsed.get("last_sale_price"):
+                new_sales += 1
+            if parsed.get("sqft_living"):
+                new_sqft += 1
+
+            if (i + 1) % 25 == 0:
+                logger.info(
+                    "Progress: %d/%d (%.1f%%) — %d scraped, %d errors, "
+                    "+%d sales, +%d sqft",
+                    i + 1, total, 100 * (i + 1) / total,
+                    scraped, errors, new_sales, new_sqft,
+                )
+
+            # Periodic checkpoint: only the updates since the last one hit disk
+            if scraped > 0 and scraped % args.save_interval == 0:
+                journal.flush()
+    finally:
+        # Drop queued accounts on early exit; in-flight fetches finish first
+        pool.shutdown(wait=True, cancel_futures=True)
+        if parse_pool is not None:
+            parse_pool.shutdown(wait=True)
+        writer.shutdown(wait=True)
+        journal.close()
+
+    # Surface the first failed per-account write, if any
+    for write in writes:
+        write.result()
 
     # Final save
     if scraped > 0:
         logger.info("Final save — %d scraped, %d errors, +%d sales, +%d sqft",
                      scraped, errors, new_sales, new_sqft)
         save_parcels(parcels)
+    journal_path.unlink(missing_ok=True)
 
     logger.info("Done. Scraped %d, errors %d, new sales %d, new sqft %d",
                 scraped, errors, new_sales, new_sqft)
@@ -1,5 +1,6 @@
 """Configuration constants for the Jackson County data pipeline."""
 
+import json
 from pathlib import Path
 
 # ── Paths ──────────────────────────────────────────────────────────────────
@@ -10,6 +11,12 @@ AGGREGATES_DIR = DATA_DIR / "aggregates"
 CACHE_DIR = DATA_DIR / "cache"
 PARCELS_JSON = DATA_DIR / "parcels.json"
 
+# ── JSON output ───────────────────────────────────────────────────────────
+# Per-account sales files and aggregates are only read by the frontends, so
+# they are written compact; parcels.json keeps its indentation for people
+# reading it
+SALES_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 # ── Jackson County PDO URLs ────────────────────────────────────────────────
 PDO_BASE = "https://pdo.jacksoncountyor.gov/pdo"
 PDO_SALES_URL = f"{PDO_BASE}/sales.cfm"                  # ?account={{ACCOUNT_ID}}
@@ -41,10 +48,16 @@ ASHLAND_CENTER_LNG = -122.7095
 ASHLAND_MAP_PREFIX = "391E"
 
 # ── Scraper settings ──────────────────────────────────────────────────────
-REQUEST_DELAY_SEC = 0.75        # seconds between requests (be polite)
+REQUEST_DELAY_SEC = 0.75        # seconds between PDO requests in total, across all workers (be polite)
+SCRAPE_WORKERS = 4              # PDO accounts scraped concurrently; together still one request per REQUEST_DELAY_SEC
 MAX_RETRIES = 3
 RETRY_BACKOFF_SEC = 2.0
 REQUEST_TIMEOUT_SEC = 30
+ARCGIS_REQUEST_DELAY_SEC = 0.5  # seconds between ArcGIS page requests in total, across page workers
+PROBE_TIMEOUT_SEC = 3           # count-only health check before paginating a flaky endpoint
+ARCGIS_CACHE_TTL_SEC = 3600     # reuse cached ArcGIS query pages this fresh without asking
+ARCGIS_CACHE_STALE_SEC = 86400  # fall back to cached pages this old when a query fails
+HTTP_POOL_SIZE = 32             # keep-alive connections kept per host
 USER_AGENT = (
     "AshlandMarketHeatMap/1.0 "
     "(personal real estate research; "
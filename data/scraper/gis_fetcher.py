@@ -10,26 +10,37 @@ Strategy:
 4. Normalize maptaxlot formats between sources (AGOL uses shorter format)
 """
 
+import hashlib
 import json
 import logging
+import math
+import os
 import re
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
 from typing import Any
 
 import requests
 
 from config import (
+    ARCGIS_CACHE_STALE_SEC,
+    ARCGIS_CACHE_TTL_SEC,
     ASHLAND_CENTER_LAT,
     ASHLAND_CENTER_LNG,
     ASHLAND_MAP_PREFIX,
+    ARCGIS_REQUEST_DELAY_SEC,
+    CACHE_DIR,
     JCGIS_AGOL,
-    MAX_RETRIES,
     ODOT_TAXLOTS,
+    PROBE_TIMEOUT_SEC,
     REQUEST_TIMEOUT_SEC,
-    RETRY_BACKOFF_SEC,
     TAXLOT_ENDPOINTS,
-    USER_AGENT,
 )
+from http_session import RateLimiter, make_session
 
 logger = logging.getLogger(__name__)
 
@@ -41,8 +52,38 @@ ASHLAND_BBOX = {
     "ymax": 42.25,
 }
 
-SESSION = requests.Session()
-SESSION.headers.update({"User-Agent": USER_AGENT})
+SESSION = make_session()
+# Endpoint health probes fail fast: no retries or backoff, so a dead server
+# is skipped for the next fallback straight away
+PROBE_SESSION = make_session(retries=False)
+
+# Pages requested concurrently while paginating a layer
+PAGE_WORKERS = 4
+# Page requests to the ArcGIS servers from all workers are spaced out here,
+# as the old one-page-at-a-time walk was
+ARCGIS_LIMITER = RateLimiter(ARCGIS_REQUEST_DELAY_SEC)
+
+
+def _query_cache_path(query_url: str, params: dict[str, Any]) -> Path:
+    """Return the on-disk cache file for an ArcGIS query (URL + params)."""
+    key = json.dumps([query_url, params], sort_keys=True, default=str)
+    return CACHE_DIR / "arcgis" / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def _cache_age(path: Path) -> float | None:
+    """Seconds since a cache file was written, or None if it doesn't exist."""
+    try:
+        return time.time() - path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+def _read_cached_query(path: Path) -> dict[str, Any] | None:
+    """Load a cached ArcGIS response, or None if it is missing or unreadable."""
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
 
 
 def _query_arcgis_layer(
@@ -54,12 +95,19 @@ def _query_arcgis_layer(
     result_record_count: int = 2000,
     out_sr: int = 4326,
     return_format: str = "json",
+    return_geometry: bool = True,
 ) -> dict[str, Any] | None:
-    """Query an ArcGIS REST MapServer or FeatureServer layer."""
+    """Query an ArcGIS REST MapServer or FeatureServer layer.
+
+    Successful responses are cached on disk under CACHE_DIR/arcgis. A cached
+    page younger than ARCGIS_CACHE_TTL_SEC is returned without a request, and
+    one younger than ARCGIS_CACHE_STALE_SEC stands in when the request fails.
+    Network requests are paced by ARCGIS_LIMITER.
+    """
     params: dict[str, Any] = {
         "where": where,
         "outFields": out_fields,
-        "returnGeometry": "true",
+        "returnGeometry": "true" if return_geometry else "false",
         "outSR": out_sr,
         "f": return_format,
         "resultOffset": result_offset,
@@ -73,38 +121,83 @@ def _query_arcgis_layer(
 
     query_url = f"{url}/query"
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = SESSION.get(query_url, params=params, timeout=REQUEST_TIMEOUT_SEC)
-            resp.raise_for_status()
-            data = resp.json()
-            if "error" in data:
-                logger.warning("ArcGIS error from %s: %s", url, data["error"])
-                return None
-            return data
-        except (requests.RequestException, json.JSONDecodeError) as exc:
-            wait = RETRY_BACKOFF_SEC * (2 ** attempt)
-            logger.warning(
-                "Request to %s failed (attempt %d/%d): %s — retrying in %.1fs",
-                url, attempt + 1, MAX_RETRIES, exc, wait,
-            )
-            time.sleep(wait)
-
-    logger.error("All %d attempts failed for %s", MAX_RETRIES, url)
-    return None
-
-
-def _centroid_from_rings(rings: list[list[list[float]]]) -> tuple[float | None, float | None]:
-    """Compute centroid from Esri JSON rings (list of coordinate rings)."""
-    all_points: list[list[float]] = []
-    for ring in rings:
-        all_points.extend(ring)
+    cache_path = _query_cache_path(query_url, params)
+    age = _cache_age(cache_path)
+    if age is not None and age < ARCGIS_CACHE_TTL_SEC:
+        cached = _read_cached_query(cache_path)
+        if cached is not None:
+            return cached
+        # An unreadable entry (e.g. from an interrupted write) counts as a miss
+        age = None
+
+    # Connection errors and 5xx responses are retried by the session adapter
+    ARCGIS_LIMITER.wait()
+    try:
+        resp = SESSION.get(query_url, params=params, timeout=REQUEST_TIMEOUT_SEC)
+        resp.raise_for_status()
+        data = json.loads(resp.content)
+    except (requests.RequestException, json.JSONDecodeError) as exc:
+        if age is not None and age < ARCGIS_CACHE_STALE_SEC:
+            cached = _read_cached_query(cache_path)
+            if cached is not None:
+                logger.warning("Request to %s failed (%s); using cached response", url, exc)
+                return cached
+        logger.error("Request to %s failed: %s", url, exc)
+        return None
+
+    if "error" in data:
+        logger.warning("ArcGIS error from %s: %s", url, data["error"])
+        return None
+
+    # Write to a temporary sibling and move it into place, so an interrupted
+    # write never leaves a truncated entry behind
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(resp.content)
+    os.replace(tmp_path, cache_path)
+    return data
+
+
+def _count_features(
+    url: str,
+    where: str = "1=1",
+    geometry_filter: dict[str, Any] | None = None,
+    timeout: float = REQUEST_TIMEOUT_SEC,
+    session: requests.Session = SESSION,
+) -> int | None:
+    """Return how many features match a query (returnCountOnly), or None on failure."""
+    params: dict[str, Any] = {
+        "where": where,
+        "returnCountOnly": "true",
+        "f": "json",
+    }
+    if geometry_filter:
+        params["geometry"] = json.dumps(geometry_filter)
+        params["geometryType"] = "esriGeometryEnvelope"
+        params["inSR"] = 4326
+        params["spatialRel"] = "esriSpatialRelIntersects"
 
-    if not all_points:
+    try:
+        resp = session.get(f"{url}/query", params=params, timeout=timeout)
+        resp.raise_for_status()
+        count = json.loads(resp.content).get("count")
+    except (requests.RequestException, json.JSONDecodeError) as exc:
+        logger.warning("Count query to %s failed: %s", url, exc)
+        return None
+    return count if isinstance(count, int) else None
+
+
+def _centroid_from_rings(rings: Iterable[list[list[float]]]) -> tuple[float | None, float | None]:
+    """Compute centroid from Esri JSON rings or GeoJSON polygon coordinate rings."""
+    # Transpose to per-axis columns in one pass (any z/m values ride along unused)
+    axes = list(zip(*chain.from_iterable(rings)))
+    if not axes:
         return None, None
 
-    avg_x = sum(p[0] for p in all_points) / len(all_points)
-    avg_y = sum(p[1] for p in all_points) / len(all_points)
+    xs, ys = axes[0], axes[1]
+    n = len(xs)
+    avg_x = math.fsum(xs) / n
+    avg_y = math.fsum(ys) / n
     return round(avg_y, 6), round(avg_x, 6)  # lat, lng
 
 
@@ -117,42 +210,92 @@ def _centroid_from_geojson(geom: dict[str, Any]) -> tuple[float | None, float |
 
     if gtype == "Point":
         return coords[1], coords[0]
-
-    all_points: list[list[float]] = []
     if gtype == "Polygon":
-        for ring in coords:
-            all_points.extend(ring)
-    elif gtype == "MultiPolygon":
-        for polygon in coords:
-            for ring in polygon:
-                all_points.extend(ring)
-    else:
-        return None, None
+        return _centroid_from_rings(coords)
+    if gtype == "MultiPolygon":
+        return _centroid_from_rings(chain.from_iterable(coords))
+    return None, None
+
+
+# Field-name aliases across the ArcGIS services, in order of preference
+_ESRI_MAPTAXLOT_KEYS = ("MapTaxlot", "MAPLOT", "MAPTAXLOT", "TM_MAPLOT")
+_ESRI_ACCOUNT_KEYS = ("ACCOUNT", "ACCTNO", "ACCOUNT_ID", "AccountID", "Account")
+_ESRI_ADDRESS_KEYS = ("SITEADD", "SITUS_ADDR", "SitusAddr", "ADDRESS", "SITUS",
+                      "PROP_ADDR", "FULLADDR")
+_GEOJSON_MAPTAXLOT_KEYS = ("MAPTAXLOT", "MapTaxlot", "MAP_TAXLOT")
+_GEOJSON_ACCOUNT_KEYS = ("ACCOUNT", "ACCTNO", "ACCOUNT_ID", "AccountID")
+_GEOJSON_ADDRESS_KEYS = ("SITUS_ADDR", "SitusAddr", "ADDRESS", "SITUS", "PROP_ADDR")
+
+
+def _resolve_keys(
+    sample: dict[str, Any],
+    aliases: tuple[str, ...],
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """
+    Split a field's aliases into those present in a layer's sample feature
+    and the rest, keeping preference order within each.
 
-    if not all_points:
-        return None, None
+    All features of a layer share one schema, so only the present aliases
+    need checking per feature.
+    """
+    present = tuple(key for key in aliases if key in sample)
+    rest = tuple(key for key in aliases if key not in sample)
+    return present, rest
+
+
+def _field_value(
+    attrs: dict[str, Any],
+    keys: tuple[tuple[str, ...], tuple[str, ...]],
+    skip: tuple[str, ...] = (),
+) -> str | None:
+    """
+    Return the stripped value of the first alias set on a feature, or None.
+
+    Values that strip to one of `skip` are passed over. The aliases missing
+    from the layer's sample feature are only tried if none of the others match.
+    """
+    for names in keys:
+        for key in names:
+            val = attrs.get(key)
+            if val:
+                text = str(val).strip()
+                if text not in skip:
+                    return text
+    return None
 
-    avg_lng = sum(p[0] for p in all_points) / len(all_points)
-    avg_lat = sum(p[1] for p in all_points) / len(all_points)
-    return round(avg_lat, 6), round(avg_lng, 6)
 
+def _non_empty_values(attrs: dict[str, Any]) -> dict[str, Any]:
+    """Return a feature's attributes minus None and blank-string values."""
+    # Only strings can be blank; other values are kept without a str() round trip
+    return {k: v for k, v in attrs.items()
+            if v is not None and (not isinstance(v, str) or v.strip())}
 
-def _extract_parcels_esri_json(data: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract parcel records from Esri JSON format (rings geometry)."""
+
+def _extract_parcels_esri_json(
+    data: dict[str, Any],
+    keep_raw: bool = False,
+) -> list[dict[str, Any]]:
+    """Extract parcel records from Esri JSON format (rings geometry).
+
+    The feature's non-empty attributes are kept under raw_props only when
+    keep_raw is set.
+    """
     parcels = []
     features = data.get("features", [])
+    if not features:
+        return parcels
+
+    sample = features[0].get("attributes", {})
+    maptaxlot_keys = _resolve_keys(sample, _ESRI_MAPTAXLOT_KEYS)
+    account_keys = _resolve_keys(sample, _ESRI_ACCOUNT_KEYS)
+    address_keys = _resolve_keys(sample, _ESRI_ADDRESS_KEYS)
 
     for feat in features:
         attrs = feat.get("attributes", {})
         geom = feat.get("geometry", {})
 
         # Try to find maptaxlot (different field names across services)
-        maptaxlot = ""
-        for key in ["MapTaxlot", "MAPLOT", "MAPTAXLOT", "TM_MAPLOT"]:
-            val = attrs.get(key)
-            if val:
-                maptaxlot = str(val).strip().replace("-", "")
-                break
+        maptaxlot = (_field_value(attrs, maptaxlot_keys) or "").replace("-", "")
         if not maptaxlot:
             continue
 
@@ -160,21 +303,10 @@ def _extract_parcels_esri_json(data: dict[str, Any]) -> list[dict[str, Any]]:
         lat, lng = _centroid_from_rings(rings) if rings else (None, None)
 
         # Try to find account number
-        account = ""
-        for key in ["ACCOUNT", "ACCTNO", "ACCOUNT_ID", "AccountID", "Account"]:
-            val = attrs.get(key)
-            if val and str(val).strip() and str(val).strip() != "0":
-                account = str(val).strip()
-                break
+        account = _field_value(attrs, account_keys, skip=("", "0")) or ""
 
         # Try to find address
-        address = ""
-        for key in ["SITEADD", "SITUS_ADDR", "SitusAddr", "ADDRESS", "SITUS",
-                     "PROP_ADDR", "FULLADDR"]:
-            val = attrs.get(key)
-            if val and str(val).strip():
-                address = str(val).strip()
-                break
+        address = _field_value(attrs, address_keys, skip=("",)) or ""
 
         parcel = {
             "account": account,
@@ -182,40 +314,40 @@ def _extract_parcels_esri_json(data: dict[str, Any]) -> list[dict[str, Any]]:
             "address": address,
             "lat": lat,
             "lng": lng,
-            "raw_props": {k: v for k, v in attrs.items()
-                          if v is not None and str(v).strip() != ""},
         }
+        if keep_raw:
+            parcel["raw_props"] = _non_empty_values(attrs)
         parcels.append(parcel)
 
     return parcels
 
 
-def _extract_parcels_geojson(geojson: dict[str, Any]) -> list[dict[str, Any]]:
-    """Extract parcel records from GeoJSON format."""
+def _extract_parcels_geojson(
+    geojson: dict[str, Any],
+    keep_raw: bool = False,
+) -> list[dict[str, Any]]:
+    """Extract parcel records from GeoJSON format.
+
+    The feature's non-empty properties are kept under raw_props only when
+    keep_raw is set.
+    """
     parcels = []
     features = geojson.get("features", [])
+    if not features:
+        return parcels
+
+    sample = features[0].get("properties", {})
+    maptaxlot_keys = _resolve_keys(sample, _GEOJSON_MAPTAXLOT_KEYS)
+    account_keys = _resolve_keys(sample, _GEOJSON_ACCOUNT_KEYS)
+    address_keys = _resolve_keys(sample, _GEOJSON_ADDRESS_KEYS)
 
     for feat in features:
         props = feat.get("properties", {})
         geom = feat.get("geometry", {})
 
-        maptaxlot = ""
-        for key in ["MAPTAXLOT", "MapTaxlot", "MAP_TAXLOT"]:
-            if key in props and props[key]:
-                maptaxlot = str(props[key]).strip()
-                break
-
-        account = ""
-        for key in ["ACCOUNT", "ACCTNO", "ACCOUNT_ID", "AccountID"]:
-            if key in props and props[key]:
-                account = str(props[key]).strip()
-                break
-
-        address = ""
-        for key in ["SITUS_ADDR", "SitusAddr", "ADDRESS", "SITUS", "PROP_ADDR"]:
-            if key in props and props[key]:
-                address = str(props[key]).strip()
-                break
+        maptaxlot = _field_value(props, maptaxlot_keys) or ""
+        account = _field_value(props, account_keys) or ""
+        address = _field_value(props, address_keys) or ""
 
         if not maptaxlot and not account:
             continue
@@ -228,14 +360,23 @@ def _extract_parcels_geojson(geojson: dict[str, Any]) -> list[dict[str, Any]]:
             "address": address,
             "lat": lat,
             "lng": lng,
-            "raw_props": {k: v for k, v in props.items()
-                          if v is not None and str(v).strip() != ""},
         }
+        if keep_raw:
+            parcel["raw_props"] = _non_empty_values(props)
         parcels.append(parcel)
 
     return parcels
 
 
+def _is_last_page(data: dict[str, Any], page_size: int) -> bool:
+    """Check whether an ArcGIS query page is the last one of its result set."""
+    # Check if we've got all the features
+    if len(data.get("features", [])) < page_size:
+        return True
+    # Check for exceededTransferLimit
+    return data.get("exceededTransferLimit") is False
+
+
 def _fetch_all_pages(
     url: str,
     where: str = "1=1",
@@ -243,16 +384,32 @@ def _fetch_all_pages(
     geometry_filter: dict[str, Any] | None = None,
     page_size: int = 2000,
     return_format: str = "json",
+    return_geometry: bool = True,
+    keep_raw: bool = False,
+    total: int | None = None,
 ) -> list[dict[str, Any]]:
-    """Paginate through all results from an ArcGIS REST layer."""
+    """Paginate through all results from an ArcGIS REST layer.
+
+    Pages are requested PAGE_WORKERS at a time and consumed in offset order,
+    stopping at the same page the one-at-a-time walk would stop at. When the
+    layer reports its feature count up front, no pages past the end are
+    requested. With return_geometry=False the polygons are left out of the
+    response and the parcels come back without lat/lng. keep_raw is passed
+    through to the extract function. Pass total when the feature count is
+    already known, to skip the count query.
+    """
     all_parcels: list[dict[str, Any]] = []
-    offset = 0
     extract_fn = (_extract_parcels_esri_json if return_format == "json"
                   else _extract_parcels_geojson)
 
-    while True:
-        logger.info("Fetching offset=%d from %s", offset, url)
-        data = _query_arcgis_layer(
+    if total is None:
+        total = _count_features(url, where=where, geometry_filter=geometry_filter)
+    if total == 0:
+        logger.info("No matching features at %s", url)
+        return all_parcels
+
+    def fetch_page(offset: int) -> dict[str, Any] | None:
+        return _query_arcgis_layer(
             url,
             where=where,
             out_fields=out_fields,
@@ -260,29 +417,30 @@ def _fetch_all_pages(
             result_offset=offset,
             result_record_count=page_size,
             return_format=return_format,
+            return_geometry=return_geometry,
         )
-        if data is None:
-            break
 
-        parcels = extract_fn(data)
-        if not parcels:
-            break
+    offset = 0
+    with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as pool:
+        while total is None or offset < total:
+            offsets = [offset + k * page_size for k in range(PAGE_WORKERS)]
+            if total is not None:
+                offsets = [o for o in offsets if o < total]
+            logger.info("Fetching offsets %d-%d from %s", offsets[0], offsets[-1], url)
 
-        all_parcels.extend(parcels)
-        logger.info("  Got %d parcels (total so far: %d)", len(parcels), len(all_parcels))
+            for data in pool.map(fetch_page, offsets):
+                parcels = extract_fn(data, keep_raw) if data is not None else []
+                if not parcels:
+                    return all_parcels
 
-        # Check if we've got all the features
-        feat_key = "features"
-        num_returned = len(data.get(feat_key, []))
-        if num_returned < page_size:
-            break
+                all_parcels.extend(parcels)
+                logger.info("  Got %d parcels (total so far: %d)",
+                            len(parcels), len(all_parcels))
 
-        # Check for exceededTransferLimit
-        if data.get("exceededTransferLimit") is False:
-            break
+                if _is_last_page(data, page_size):
+                    return all_parcels
 
-        offset += page_size
-        time.sleep(0.5)  # Be polite between pages
+            offset = offsets[-1] + page_size
 
     return all_parcels
 
@@ -297,16 +455,25 @@ def fetch_ashland_parcels() -> list[dict[str, Any]]:
     3. JCGIS AGOL hosted layer (has MAPLOT + TM_MAPLOT + geometry)
 
     Returns a list of parcel dicts with:
-    - account, maptaxlot, address, lat, lng, raw_props
+    - account, maptaxlot, address, lat, lng
     """
     # ── Try Jackson County spatial server first (has best data when up) ──
     for endpoint in TAXLOT_ENDPOINTS:
         logger.info("Trying Jackson County endpoint: %s", endpoint)
+        where = f"MAPLOT LIKE '{ASHLAND_MAP_PREFIX}%'"
+        # These servers are intermittently down; a quick count query tells
+        # us before we sit through full-size page timeouts and retries
+        total = _count_features(endpoint, where=where, timeout=PROBE_TIMEOUT_SEC,
+                                session=PROBE_SESSION)
+        if not total:
+            logger.info("No parcel count from %s, skipping", endpoint)
+            continue
         parcels = _fetch_all_pages(
             endpoint,
-            where=f"MAPLOT LIKE '{ASHLAND_MAP_PREFIX}%'",
+            where=where,
             page_size=1000,
             return_format="json",
+            total=total,
         )
         if parcels:
             logger.info("Got %d Ashland parcels from %s", len(parcels), endpoint)
@@ -342,21 +509,31 @@ def fetch_ashland_parcels() -> list[dict[str, Any]]:
 
 def _filter_ashland(parcels: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Filter parcels to those within Ashland (by maptaxlot prefix or bbox)."""
+    # Bounds read once instead of four dict lookups per parcel
+    ymin, ymax = ASHLAND_BBOX["ymin"], ASHLAND_BBOX["ymax"]
+    xmin, xmax = ASHLAND_BBOX["xmin"], ASHLAND_BBOX["xmax"]
+
     ashland = []
     for p in parcels:
         mt = p.get("maptaxlot", "")
-        if mt and mt.startswith(ASHLAND_MAP_PREFIX):
-            ashland.append(p)
-        elif not mt and p.get("lat") and p.get("lng"):
-            lat, lng = p["lat"], p["lng"]
-            if (ASHLAND_BBOX["ymin"] <= lat <= ASHLAND_BBOX["ymax"]
-                    and ASHLAND_BBOX["xmin"] <= lng <= ASHLAND_BBOX["xmax"]):
+        if mt:
+            if mt.startswith(ASHLAND_MAP_PREFIX):
                 ashland.append(p)
+            continue
+        lat = p.get("lat")
+        lng = p.get("lng")
+        if lat and lng and ymin <= lat <= ymax and xmin <= lng <= xmax:
+            ashland.append(p)
 
     logger.info("Filtered to %d Ashland parcels (from %d total)", len(ashland), len(parcels))
     return ashland
 
 
+# Section, optional quarter-section letters and lot number of a maptaxlot
+_MT_RE = re.compile(r"^(\d{2})([A-Da-d]{0,2})(\d+)$")
+
+
+@lru_cache(maxsize=32768)
 def normalize_maptaxlot(mt: str) -> str:
     """Normalize a maptaxlot to ODOT 13-char format.
 
@@ -372,7 +549,7 @@ def normalize_maptaxlot(mt: str) -> str:
     prefix = mt[:4]  # e.g. '391E'
     rest = mt[4:]
 
-    m = re.match(r"^(\d{2})([A-Da-d]{0,2})(\d+)$", rest)
+    m = _MT_RE.match(rest)
     if not m:
         return mt
 
@@ -403,6 +580,8 @@ def fetch_agol_enrichment() -> dict[str, dict[str, Any]]:
         out_fields=out_fields,
         page_size=1000,
         return_format="json",
+        return_geometry=False,  # only attributes are used; polygons dominate the payload
+        keep_raw=True,
     )
 
     enrichment: dict[str, dict[str, Any]] = {}
@@ -432,9 +611,6 @@ def fetch_agol_enrichment() -> dict[str, dict[str, Any]]:
             "owner": str(props.get("FEEOWNER", "")).strip(),
             "prop_class": props.get("PROPCLASS"),
         }
-        # Also store under raw maptaxlot for direct matches
-        if raw_mt != norm_mt:
-            enrichment[raw_mt] = enrichment[norm_mt]
 
     logger.info(
         "AGOL enrichment: %d parcels with account data", len(enrichment)
@@ -448,15 +624,16 @@ def enrich_parcels(
 ) -> tuple[list[dict[str, Any]], int]:
     """Merge AGOL enrichment data into parcel records.
 
-    Matches by maptaxlot. Returns (updated_parcels, match_count).
+    Matches by normalized maptaxlot, the form fetch_agol_enrichment keys by.
+    Returns (updated_parcels, match_count).
     """
     matched = 0
-    seen_mts: set[str] = set()
+    existing_mts: set[str] = set()
 
     for parcel in parcels:
-        mt = parcel.get("maptaxlot", "")
+        mt = normalize_maptaxlot(parcel.get("maptaxlot", ""))
         if mt:
-            seen_mts.add(mt)
+            existing_mts.add(mt)
 
         data = enrichment.get(mt)
         if not data:
@@ -478,17 +655,15 @@ def enrich_parcels(
     # Add new parcels from AGOL that don't exist in current set
     new_count = 0
     for mt, data in enrichment.items():
-        norm = normalize_maptaxlot(mt)
-        if norm in seen_mts or mt in seen_mts:
+        if mt in existing_mts:
             continue
-        seen_mts.add(norm)
 
         parcel = {
             "account": data.get("account", ""),
             "lat": None,
             "lng": None,
             "address": data.get("address", ""),
-            "maptaxlot": norm,
+            "maptaxlot": mt,
             "sqft_living": None,
             "sqft_lot": data.get("sqft_lot"),
             "year_built": data.get("year_built"),
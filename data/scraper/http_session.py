@@ -0,0 +1,66 @@
+"""Shared HTTP session setup and request pacing for the scrapers."""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HTTP_POOL_SIZE, MAX_RETRIES, RETRY_BACKOFF_SEC, USER_AGENT
+
+
+def make_session(
+    headers: dict[str, str] | None = None,
+    retries: bool = True,
+) -> requests.Session:
+    """
+    Build a requests session that sends USER_AGENT plus any extra headers.
+
+    Keep-alive connections are pooled (HTTP_POOL_SIZE per host) so concurrent
+    workers can share one session. With retries, connection errors, 429s and
+    5xx responses to GETs are retried with exponential backoff by urllib3
+    (MAX_RETRIES attempts in all); without, the first failure is raised.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    if headers:
+        session.headers.update(headers)
+
+    max_retries: Retry | int = 0
+    if retries:
+        max_retries = Retry(
+            total=MAX_RETRIES - 1,
+            backoff_factor=RETRY_BACKOFF_SEC,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+        )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                          max_retries=max_retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RateLimiter:
+    """
+    Space requests at least `interval` seconds apart across all threads.
+
+    Each wait() reserves the next free slot under a lock and sleeps outside
+    it, so any number of workers together stay at 1/interval requests/s.
+    """
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
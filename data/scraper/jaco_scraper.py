@@ -19,6 +19,7 @@ The pipeline produces:
 import argparse
 import json
 import logging
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -32,6 +33,8 @@ from config import (
     DATA_DIR,
     PARCELS_JSON,
     SALES_DIR,
+    SALES_ENCODER,
+    SCRAPE_WORKERS,
 )
 
 logger = logging.getLogger(__name__)
@@ -98,7 +101,7 @@ def cmd_scrape(args: argparse.Namespace) -> None:
     Uses account numbers when available. The Ora_asmt_details.cfm page
     is the richest data source (has improvements, values, sales, addresses).
     """
-    from pdo_scraper import fetch_page, is_cached
+    from pdo_scraper import cached_accounts, fetch_page, safe_account
 
     logger.info("=== Step 2: Scraping PDO pages ===")
     parcels = _load_parcels_json()
@@ -114,49 +117,90 @@ def cmd_scrape(args: argparse.Namespace) -> None:
     if args.pages:
         page_types = args.pages.split(",")
 
-    import time
-    from config import REQUEST_DELAY_SEC
+    from concurrent.futures import ThreadPoolExecutor
 
-    # Filter to uncached parcels (unless --force)
+    # Cached pages per type, from one directory scan each (empty with --force)
+    cached = {pt: set() if args.force else cached_accounts(pt) for pt in page_types}
+
+    # One target per account: parcels can share an account, and fetching it
+    # once per parcel would have two workers writing the same cache file
+    accounts: dict[str, str] = {}
+    for p in with_account:
+        accounts.setdefault(safe_account(p["account"]), p["account"])
+    logger.info("%d distinct accounts", len(accounts))
+
+    # Filter to uncached accounts (unless --force)
     if not args.force:
-        targets = [p for p in with_account
-                   if any(not is_cached(p["account"], pt) for pt in page_types)]
-        logger.info("%d parcels need scraping (not yet cached)", len(targets))
+        targets = [acct for safe_acct, acct in accounts.items()
+                   if any(safe_acct not in cached[pt] for pt in page_types)]
+        logger.info("%d accounts need scraping (not yet cached)", len(targets))
     else:
-        targets = with_account
+        targets = list(accounts.values())
 
     # Apply limit if specified
     if args.limit > 0:
         targets = targets[: args.limit]
-        logger.info("Limited to %d parcels", len(targets))
+        logger.info("Limited to %d accounts", len(targets))
 
     total = len(targets)
     done = 0
     fetched = 0
 
-    for p in targets:
-        acct = p["account"]
+    def scrape_account(acct: str) -> int:
+        """Fetch an account's uncached pages; returns how many were fetched."""
+        count = 0
+        safe_acct = safe_account(acct)
         for pt in page_types:
-            if not args.force and is_cached(acct, pt):
+            if safe_acct in cached[pt]:
                 continue
             result = fetch_page(acct, pt, force=args.force)
             if result:
-                fetched += 1
-            time.sleep(REQUEST_DELAY_SEC)
-        done += 1
-        if done % 25 == 0:
-            logger.info("Progress: %d/%d (%.1f%%), %d new pages fetched",
-                         done, total, 100 * done / total, fetched)
-
-    logger.info("Scraping complete: %d parcels processed, %d new pages fetched.",
+                count += 1
+        return count
+
+    # fetch_page paces all workers together at one request per REQUEST_DELAY_SEC;
+    # more workers only overlap the waits on slow responses
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        for count in pool.map(scrape_account, targets):
+            fetched += count
+            done += 1
+            if done % 25 == 0:
+                logger.info("Progress: %d/%d (%.1f%%), %d new pages fetched",
+                             done, total, 100 * done / total, fetched)
+
+    logger.info("Scraping complete: %d accounts processed, %d new pages fetched.",
                 total, fetched)
 
 
-def cmd_parse(args: argparse.Namespace) -> None:
-    """Step 3: Parse cached HTML into structured JSON files."""
+def _parse_cached(cache_key: str) -> dict[str, Any] | None:
+    """Parse an account's cached PDO pages. Returns None if none are cached.
+
+    Runs in cmd_parse's worker processes, so it only takes and returns
+    picklable values.
+    """
     from parser import parse_account
     from pdo_scraper import read_cached
 
+    # Read cached HTML
+    sales_html = read_cached(cache_key, "sales")
+    detail_html = read_cached(cache_key, "detail")
+    permit_html = read_cached(cache_key, "permit")
+
+    if not any([sales_html, detail_html, permit_html]):
+        return None
+
+    # Parse into structured data
+    return parse_account(sales_html, detail_html, permit_html)
+
+
+def cmd_parse(args: argparse.Namespace) -> None:
+    """Step 3: Parse cached HTML into structured JSON files.
+
+    Accounts are parsed in parallel worker processes; results are applied
+    and written in parcel order on the main process.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
     logger.info("=== Step 3: Parsing cached HTML ===")
     parcels = _load_parcels_json()
     if not parcels:
@@ -165,42 +209,37 @@ def cmd_parse(args: argparse.Namespace) -> None:
 
     SALES_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Use account or maptaxlot as the cache key
+    keyed = [
+        (i, parcel, cache_key)
+        for i, parcel in enumerate(parcels)
+        if (cache_key := parcel.get("account") or parcel.get("maptaxlot", ""))
+    ]
+
     updated = 0
-    for i, parcel in enumerate(parcels):
-        # Use account or maptaxlot as the cache key
-        cache_key = parcel.get("account") or parcel.get("maptaxlot", "")
-        if not cache_key:
-            continue
-
-        # Read cached HTML
-        sales_html = read_cached(cache_key, "sales")
-        detail_html = read_cached(cache_key, "detail")
-        permit_html = read_cached(cache_key, "permit")
-
-        if not any([sales_html, detail_html, permit_html]):
-            continue
-
-        # Parse into structured data
-        parsed = parse_account(sales_html, detail_html, permit_html)
-
-        # Write per-parcel detail file (keyed by account or maptaxlot)
-        account_file = SALES_DIR / f"{cache_key}.json"
-        detail_data = {
-            "account": parcel.get("account", ""),
-            "maptaxlot": parcel.get("maptaxlot", ""),
-            "sales": parsed.get("sales", []),
-            "permits": parsed.get("permits", []),
-            "improvements": parsed.get("improvements", []),
-        }
-        with open(account_file, "w") as f:
-            json.dump(detail_data, f, indent=2)
+    with ProcessPoolExecutor() as pool:
+        results = pool.map(_parse_cached, [key for _, _, key in keyed], chunksize=32)
+        for (i, parcel, cache_key), parsed in zip(keyed, results):
+            if parsed is None:
+                continue
+
+            # Write per-parcel detail file (keyed by account or maptaxlot)
+            account_file = SALES_DIR / f"{cache_key}.json"
+            detail_data = {
+                "account": parcel.get("account", ""),
+                "maptaxlot": parcel.get("maptaxlot", ""),
+                "sales": parsed.get("sales", []),
+                "permits": parsed.get("permits", []),
+                "improvements": parsed.get("improvements", []),
+            }
+            account_file.write_text(SALES_ENCODER.encode(detail_data))
 
-        # Update master parcel record
-        _update_parcel_from_parsed(parcel, parsed)
-        updated += 1
+            # Update master parcel record
+            _update_parcel_from_parsed(parcel, parsed)
+            updated += 1
 
-        if (i + 1) % 100 == 0:
-            logger.info("Parsed %d/%d accounts", i + 1, len(parcels))
+            if (i + 1) % 100 == 0:
+                logger.info("Parsed %d/%d accounts", i + 1, len(parcels))
 
     _write_parcels_json(parcels)
     logger.info("Parse complete: %d accounts updated, wrote %s", updated, PARCELS_JSON)
@@ -274,21 +313,25 @@ def _load_parcels_json() -> list[dict[str, Any]]:
     """Load parcels.json and return the parcels list."""
     if not PARCELS_JSON.exists():
         return []
-    with open(PARCELS_JSON) as f:
-        data = json.load(f)
+    data = json.loads(PARCELS_JSON.read_bytes())
     return data.get("parcels", [])
 
 
 def _write_parcels_json(parcels: list[dict[str, Any]]) -> None:
-    """Write parcels.json with the standard wrapper."""
+    """Write parcels.json with the standard wrapper.
+
+    The document is encoded in one call and written to a temporary sibling
+    that replaces parcels.json, so readers never see a half-written file.
+    """
     PARCELS_JSON.parent.mkdir(parents=True, exist_ok=True)
     data = {
         "generated": datetime.now(timezone.utc).isoformat(),
         "count": len(parcels),
         "parcels": parcels,
     }
-    with open(PARCELS_JSON, "w") as f:
-        json.dump(data, f, indent=2)
+    tmp_path = PARCELS_JSON.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(data, indent=2))
+    os.replace(tmp_path, PARCELS_JSON)
 
 
 def _update_parcel_from_parsed(
@@ -307,21 +350,23 @@ def _update_parcel_from_parsed(
         parcel["assessed_value"] = parsed["assessed_value"]
 
     # Last sale — may come directly from detail page or from sales list
+    sales = parsed.get("sales", [])
     if parsed.get("last_sale_price"):
         parcel["last_sale_price"] = parsed["last_sale_price"]
         parcel["last_sale_date"] = parsed.get("last_sale_date")
     else:
-        # Fallback: from sales history list
-        sales = parsed.get("sales", [])
-        for sale in sales:
-            price = sale.get("price")
-            if price and price > 0:
-                parcel["last_sale_price"] = price
-                parcel["last_sale_date"] = sale.get("date")
-                break
+        # Fallback: the most recent priced sale in the sales history list
+        latest = max(
+            (sale for sale in sales if (sale.get("price") or 0) > 0),
+            key=lambda sale: sale.get("date") or "",
+            default=None,
+        )
+        if latest is not None:
+            parcel["last_sale_price"] = latest["price"]
+            parcel["last_sale_date"] = latest.get("date")
 
     # Sales and permits counts
-    parcel["num_sales"] = len(parsed.get("sales", []))
+    parcel["num_sales"] = len(sales)
     parcel["num_permits"] = len(parsed.get("permits", []))
 
     # Compute $/sqft
@@ -358,7 +403,9 @@ def main() -> None:
     sub_scrape.add_argument("--pages", type=str, default=None,
                              help="Comma-separated page types: sales,detail,permit")
     sub_scrape.add_argument("--limit", type=int, default=0,
-                             help="Max number of parcels to scrape (0=all)")
+                             help="Max number of accounts to scrape (0=all)")
+    sub_scrape.add_argument("--workers", type=int, default=SCRAPE_WORKERS,
+                             help="Number of accounts to scrape concurrently")
     sub_scrape.set_defaults(func=cmd_scrape)
 
     # parse
@@ -373,6 +420,8 @@ def main() -> None:
     sub_all = subparsers.add_parser("all", help="Run all pipeline steps")
     sub_all.add_argument("--force", action="store_true", help="Force re-scrape")
     sub_all.add_argument("--pages", type=str, default=None)
+    sub_all.add_argument("--workers", type=int, default=SCRAPE_WORKERS,
+                         help="Number of accounts to scrape concurrently")
     sub_all.set_defaults(func=cmd_all)
 
     # status
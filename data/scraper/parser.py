@@ -7,28 +7,79 @@ Handles three page types:
 - Permit history → list of permits
 """
 
+import calendar
 import logging
 import re
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
-from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+_NONDIGIT_DOT_RE = re.compile(r"[^\d.]")
+_NONDIGIT_RE = re.compile(r"[^\d]")
+# str.translate tables deleting ASCII non-digits (keeping "." in the second);
+# cheaper than the regexes above on short cell text, which is nearly always
+# ASCII. Whatever non-ASCII text is left still goes through the regex.
+_ASCII_NONDIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit()))
+_ASCII_NONDIGITS_DOT = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit() and chr(c) != "."))
+# MM/DD/YYYY (or with dashes, or a 2-digit year) embedded in larger text
+_MDY_RE = re.compile(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})")
+
+# The whole-string forms of _DATE_FORMATS in one pattern: MM/DD/YYYY and
+# MM-DD-YYYY, MM/DD/YY, YYYY-MM-DD, and "Jan 5, 1999" / "January 5, 1999".
+# _parse_date builds the date from the groups and only reaches strptime for
+# anything else (such as years outside 1000-2999).
+_DATE_RE = re.compile(
+    r"(?P<m>\d{1,2})(?P<sep>[/-])(?P<d>\d{1,2})(?P=sep)(?P<y>[12]\d{3})"
+    r"|(?P<m2>\d{1,2})/(?P<d2>\d{1,2})/(?P<yy>\d{2})"
+    r"|(?P<y3>[12]\d{3})-(?P<m3>\d{1,2})-(?P<d3>\d{1,2})"
+    r"|(?P<mon>[a-z]+)\s+(?P<d4>\d{1,2}),\s+(?P<y4>[12]\d{3})",
+    re.IGNORECASE,
+)
+_MONTH_NUMBERS = {
+    name.lower(): number
+    for names in (calendar.month_abbr, calendar.month_name)
+    for number, name in enumerate(names) if name
+}
+
+# Date formats _parse_date tries, in order
+_DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%Y-%m-%d",
+    "%m/%d/%y",
+    "%b %d, %Y",
+    "%B %d, %Y",
+)
+
 
 def _clean_text(text: str | None) -> str:
     """Strip whitespace and normalize a text string."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text.strip())
+    return _WS_RE.sub(" ", text.strip())
+
 
+# The value parsers below are pure functions of the cell text, and PDO pages
+# repeat the same dates, prices and "$0" placeholders across tables, so their
+# results are memoized.
 
+@lru_cache(maxsize=4096)
 def _parse_price(text: str) -> int | None:
     """Parse a price string like '$425,000' or '425000' into an integer."""
     if not text:
         return None
-    cleaned = re.sub(r"[^\d.]", "", text)
+    cleaned = text.translate(_ASCII_NONDIGITS_DOT)
+    if not cleaned.isascii():
+        cleaned = _NONDIGIT_DOT_RE.sub("", cleaned)
     if not cleaned:
         return None
     try:
@@ -37,21 +88,38 @@ def _parse_price(text: str) -> int | None:
         return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(text: str) -> str | None:
     """Parse a date string into ISO format (YYYY-MM-DD). Handles common formats."""
     if not text:
         return None
     text = text.strip()
 
-    formats = [
-        "%m/%d/%Y",
-        "%m-%d-%Y",
-        "%Y-%m-%d",
-        "%m/%d/%y",
-        "%b %d, %Y",
-        "%B %d, %Y",
-    ]
-    for fmt in formats:
+    # Fast path: build the date from the regex groups; invalid dates such as
+    # 02/30/2020 fall through to the general handling below
+    match = _DATE_RE.fullmatch(text)
+    if match:
+        g = match.groupdict()
+        if g["y"]:
+            year, month, day = int(g["y"]), int(g["m"]), int(g["d"])
+        elif g["yy"]:
+            # strptime's %y pivot: 69-99 are 1900s, 00-68 are 2000s
+            yy = int(g["yy"])
+            year = yy + (1900 if yy >= 69 else 2000)
+            month, day = int(g["m2"]), int(g["d2"])
+        elif g["y3"]:
+            year, month, day = int(g["y3"]), int(g["m3"]), int(g["d3"])
+        else:
+            year, day = int(g["y4"]), int(g["d4"])
+            month = _MONTH_NUMBERS.get(g["mon"].lower(), 0)
+        try:
+            datetime(year, month, day)
+        except ValueError:
+            pass
+        else:
+            return f"{year:04d}-{month:02d}-{day:02d}"
+
+    for fmt in _DATE_FORMATS:
         try:
             dt = datetime.strptime(text, fmt)
             return dt.strftime("%Y-%m-%d")
@@ -59,7 +127,7 @@ def _parse_date(text: str) -> str | None:
             continue
 
     # Try regex for MM/DD/YYYY embedded in larger text
-    match = re.search(r"(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})", text)
+    match = _MDY_RE.search(text)
     if match:
         m, d, y = match.groups()
         if len(y) == 2:
@@ -74,11 +142,14 @@ def _parse_date(text: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_int(text: str) -> int | None:
     """Parse an integer from text, ignoring commas and whitespace."""
     if not text:
         return None
-    cleaned = re.sub(r"[^\d]", "", text)
+    cleaned = text.translate(_ASCII_NONDIGITS)
+    if not cleaned.isascii():
+        cleaned = _NONDIGIT_RE.sub("", cleaned)
     if not cleaned:
         return None
     try:
@@ -87,11 +158,14 @@ def _parse_int(text: str) -> int | None:
         return None
 
 
+@lru_cache(maxsize=4096)
 def _parse_float(text: str) -> float | None:
     """Parse a float from text."""
     if not text:
         return None
-    cleaned = re.sub(r"[^\d.]", "", text)
+    cleaned = text.translate(_ASCII_NONDIGITS_DOT)
+    if not cleaned.isascii():
+        cleaned = _NONDIGIT_DOT_RE.sub("", cleaned)
     if not cleaned:
         return None
     try:
@@ -100,6 +174,64 @@ def _parse_float(text: str) -> float | None:
         return None
 
 
+# One HTMLParser per thread, reused across pages (lxml parser objects are not
+# shared between threads). Comments are never read, so they are left out.
+_PARSERS = threading.local()
+
+
+def _html_parser() -> lxml_html.HTMLParser:
+    """Return this thread's reusable HTML parser."""
+    parser = getattr(_PARSERS, "parser", None)
+    if parser is None:
+        parser = _PARSERS.parser = lxml_html.HTMLParser(remove_comments=True)
+    return parser
+
+
+def _parse_html(html: str) -> lxml_html.HtmlElement:
+    """Parse a page into an lxml element tree.
+
+    The tree is shaped so that text_content() and iter() see what bs4's
+    get_text() and find_all() did: script, style and template text is
+    dropped, and content after a closing </html> (which libxml2 parks in
+    sibling root elements) is moved under the returned root. Pages lxml
+    cannot build a document from, such as empty ones, give an empty <html>
+    element.
+    """
+    try:
+        root = lxml_html.document_fromstring(html, parser=_html_parser())
+    except ValueError:
+        # str input may not carry an XML encoding declaration; parse as bytes
+        try:
+            root = lxml_html.document_fromstring(html.encode("utf-8"),
+                                                 parser=_html_parser())
+        except etree.ParserError:
+            return lxml_html.Element("html")
+    except etree.ParserError:
+        return lxml_html.Element("html")
+
+    for sibling in list(root.itersiblings()):
+        root.append(sibling)
+    etree.strip_elements(root, "script", "style", "template", with_tail=False)
+    return root
+
+
+def _has_class(el: lxml_html.HtmlElement, cls: str) -> bool:
+    """Check whether an element's class attribute lists the given class."""
+    return cls in (el.get("class") or "").split()
+
+
+def _iter_class(
+    root: lxml_html.HtmlElement, tag: str, cls: str,
+) -> list[lxml_html.HtmlElement]:
+    """Return the descendants of root with the given tag and class, in document order."""
+    return [el for el in root.iter(tag) if _has_class(el, cls)]
+
+
+def _child_cells(row: lxml_html.HtmlElement, tags: tuple[str, ...]) -> list[str]:
+    """Return the cleaned text of a row's direct child cells with the given tags."""
+    return [_clean_text(c.text_content()) for c in row if c.tag in tags]
+
+
 # ── Sales Page Parser ──────────────────────────────────────────────────────
 
 def parse_sales(html: str) -> list[dict[str, Any]]:
@@ -111,77 +243,53 @@ def parse_sales(html: str) -> list[dict[str, Any]]:
     sales table has columns: Book-Page, Sale Date, Sale Price, Grantee,
     Grantor, Document Type. The JV table has: Journal Voucher No., etc.
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = _parse_html(html)
     sales: list[dict[str, Any]] = []
 
     # Find all tables and look for ones with the right header structure
-    for table in soup.find_all("table"):
+    for table in root.iter("table"):
         # Get direct child rows only (avoid nested table pollution)
-        rows = table.find_all("tr", recursive=False)
+        rows = [r for r in table if r.tag == "tr"]
         if len(rows) < 2:
             continue
 
         # Check each row to find a header row
         for row_idx, row in enumerate(rows):
-            cells = row.find_all(["td", "th"], recursive=False)
-            cell_texts = [_clean_text(c.get_text()) for c in cells]
+            lower_texts = [t.lower() for t in _child_cells(row, ("td", "th"))]
+            joined = "\n".join(lower_texts)
 
             # Look for the ORCATS sales table header
-            if _is_sales_header(cell_texts):
+            if _is_sales_header(joined):
                 # Parse subsequent data rows
-                col_map = _map_columns(
-                    [t.lower() for t in cell_texts],
-                    {
-                        "book_page": ["book - page", "book-page", "book page"],
-                        "date": ["sale date"],
-                        "price": ["sale price"],
-                        "grantee": ["grantee"],
-                        "grantor": ["grantor"],
-                        "doc_type": ["document type"],
-                    },
-                )
+                col_map = _map_columns(lower_texts, _SALES_COLUMNS)
                 for data_row in rows[row_idx + 1:]:
-                    data_cells = data_row.find_all("td", recursive=False)
-                    data_texts = [_clean_text(c.get_text()) for c in data_cells]
-                    if len(data_texts) < 3 or all(not t for t in data_texts):
+                    data_texts = _child_cells(data_row, ("td",))
+                    if len(data_texts) < 3 or not any(data_texts):
                         continue
 
                     sale = _extract_sale_from_row(data_texts, col_map)
                     if sale:
                         sales.append(sale)
 
-            # Look for JV File table header
-            elif _is_jv_header(cell_texts):
-                col_map = _map_columns(
-                    [t.lower() for t in cell_texts],
-                    {
-                        "date": ["journal voucher date", "sale date"],
-                        "sale_date": ["sale date"],
-                        "price": ["sale $", "sale"],
-                        "owner": ["fee owner"],
-                        "instrument": ["instrument type"],
-                        "maptaxlot": ["map taxlot"],
-                    },
-                )
+            # Look for JV File table header. JV data is only used when no
+            # ORCATS sale has been found, and then only its first sale
+            elif not sales and _is_jv_header(joined):
+                col_map = _map_columns(lower_texts, _JV_COLUMNS)
                 for data_row in rows[row_idx + 1:]:
-                    data_cells = data_row.find_all("td", recursive=False)
-                    data_texts = [_clean_text(c.get_text()) for c in data_cells]
-                    if len(data_texts) < 3 or all(not t for t in data_texts):
+                    data_texts = _child_cells(data_row, ("td",))
+                    if len(data_texts) < 3 or not any(data_texts):
                         continue
 
                     sale = _extract_jv_from_row(data_texts, col_map)
-                    if sale and not sales:
-                        # Only use JV data if we didn't get ORCATS data
+                    if sale:
                         sales.append(sale)
+                        break
 
-    # Deduplicate by date+price
-    seen: set[tuple] = set()
-    unique_sales: list[dict[str, Any]] = []
+    # Deduplicate by date+price, keeping the first sale seen for each key
+    by_key: dict[tuple, dict[str, Any]] = {}
     for s in sales:
-        key = (s.get("date"), s.get("price"))
-        if key not in seen:
-            seen.add(key)
-            unique_sales.append(s)
+        by_key.setdefault((s.get("date"), s.get("price")), s)
+    unique_sales = list(by_key.values())
 
     # Sort by date descending
     unique_sales.sort(key=lambda s: s.get("date") or "", reverse=True)
@@ -189,23 +297,21 @@ def parse_sales(html: str) -> list[dict[str, Any]]:
     return unique_sales
 
 
-def _is_sales_header(texts: list[str]) -> bool:
-    """Check if a row of cell texts is the ORCATS sales table header."""
-    lower = [t.lower() for t in texts]
-    return (
-        any("sale date" in t for t in lower)
-        and any("sale price" in t or "price" in t for t in lower)
-        and any("grantee" in t for t in lower)
-    )
+def _is_sales_header(row: str) -> bool:
+    """Check if a row is the ORCATS sales table header.
+
+    row is the row's lowercased cell texts joined with newlines. Cell texts
+    are whitespace-normalized, so a keyword can't match across two cells.
+    """
+    return "sale date" in row and "price" in row and "grantee" in row
 
 
-def _is_jv_header(texts: list[str]) -> bool:
-    """Check if a row of cell texts is the JV File table header."""
-    lower = [t.lower() for t in texts]
+def _is_jv_header(row: str) -> bool:
+    """Check if a row is the JV File table header (row as for _is_sales_header)."""
     return (
-        any("journal voucher" in t for t in lower)
-        and any("instrument" in t for t in lower)
-        and any("fee owner" in t or "sale" in t for t in lower)
+        "journal voucher" in row
+        and "instrument" in row
+        and ("fee owner" in row or "sale" in row)
     )
 
 
@@ -258,6 +364,12 @@ def _extract_jv_from_row(
 
 # ── Property Detail Parser (Ora_asmt_details.cfm) ────────────────────────
 
+# Improvement types whose year built and square footage describe the home
+_RESIDENTIAL_TYPES = frozenset({
+    "RESIDENCE", "DWELLING", "MULTI-FAMILY", "MANUFACTURED", "CONDO", "TOWNHOUSE",
+})
+
+
 def parse_detail(html: str) -> dict[str, Any]:
     """
     Parse property details from the Ora_asmt_details.cfm page.
@@ -270,48 +382,54 @@ def parse_detail(html: str) -> dict[str, Any]:
     - Market Value Summary (RMV, M5, MAV, AV)
     - Improvements (building #, year built, type, sqft)
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = _parse_html(html)
     detail: dict[str, Any] = {}
 
+    # Section and field header cells, collected in one pass over the page
+    hd_tds: list[lxml_html.HtmlElement] = []
+    hd_ths: list[lxml_html.HtmlElement] = []
+    for el in root.iter("td", "th"):
+        if _has_class(el, "asmt_hd"):
+            (hd_tds if el.tag == "td" else hd_ths).append(el)
+
     # ── Last Sale (from "Sales Data" section) ──
-    _parse_last_sale(soup, detail)
+    _parse_last_sale(hd_tds, detail)
 
     # ── Market Value Summary ──
-    _parse_market_values(soup, detail)
+    _parse_market_values(root, hd_ths, detail)
 
     # ── Improvements table ──
-    detail["improvements"] = _parse_improvements_asmt(soup)
+    detail["improvements"] = _parse_improvements_asmt(hd_ths)
 
     # ── Get year_built and sqft_living from improvements ──
-    if detail["improvements"]:
-        # Use the first residential improvement
-        for imp in detail["improvements"]:
-            imp_type = (imp.get("type") or "").upper()
-            if imp_type in ("RESIDENCE", "DWELLING", "MULTI-FAMILY",
-                            "MANUFACTURED", "CONDO", "TOWNHOUSE"):
-                if imp.get("year_built") and "year_built" not in detail:
-                    detail["year_built"] = imp["year_built"]
-                if imp.get("sqft") and "sqft_living" not in detail:
-                    detail["sqft_living"] = imp["sqft"]
-                break
-        # Fallback: use any improvement with sqft
-        if "sqft_living" not in detail:
-            for imp in detail["improvements"]:
-                if imp.get("sqft") and imp["sqft"] > 0:
-                    detail["sqft_living"] = imp["sqft"]
-                    break
-        if "year_built" not in detail:
-            for imp in detail["improvements"]:
-                if imp.get("year_built"):
-                    detail["year_built"] = imp["year_built"]
-                    break
+    # Prefer the first residential improvement; fall back to the first
+    # improvement with sqft and the first with a year built
+    residential: dict[str, Any] = {}
+    first_sqft = first_year = None
+    for imp in detail["improvements"]:
+        if not residential and (imp.get("type") or "").upper() in _RESIDENTIAL_TYPES:
+            residential = imp
+        if first_sqft is None and imp.get("sqft") and imp["sqft"] > 0:
+            first_sqft = imp["sqft"]
+        if first_year is None and imp.get("year_built"):
+            first_year = imp["year_built"]
+        if residential and first_sqft is not None and first_year is not None:
+            break
+
+    year_built = residential.get("year_built") or first_year
+    if year_built:
+        detail["year_built"] = year_built
+    sqft_living = residential.get("sqft") or first_sqft
+    if sqft_living:
+        detail["sqft_living"] = sqft_living
 
     # ── Acreage (from Land Info section) ──
-    for td in soup.find_all("td", class_="asmt_hd"):
-        if _clean_text(td.get_text()).lower() == "acreage":
-            val_td = td.find_next_sibling("td", class_="asmt_info")
-            if val_td:
-                acreage = _parse_float(val_td.get_text())
+    for td in hd_tds:
+        if _clean_text(td.text_content()).lower() == "acreage":
+            val_td = next((s for s in td.itersiblings("td") if _has_class(s, "asmt_info")),
+                          None)
+            if val_td is not None:
+                acreage = _parse_float(val_td.text_content())
                 if acreage and acreage > 0:
                     detail["sqft_lot"] = int(round(acreage * 43560))
             break
@@ -319,59 +437,71 @@ def parse_detail(html: str) -> dict[str, Any]:
     return detail
 
 
-def _parse_last_sale(soup: BeautifulSoup, detail: dict[str, Any]) -> None:
-    """Extract last sale price and date from the Sales Data section."""
+def _parse_last_sale(
+    hd_tds: list[lxml_html.HtmlElement], detail: dict[str, Any],
+) -> None:
+    """Extract last sale price and date from the Sales Data section.
+
+    hd_tds are the page's td.asmt_hd cells in document order.
+    """
     # Find "Last Sale" header cell
-    for td in soup.find_all("td", class_="asmt_hd"):
-        text = _clean_text(td.get_text())
+    for td in hd_tds:
+        text = _clean_text(td.text_content())
         if "last sale" in text.lower():
             # The data row follows in the next <tr>
-            header_row = td.find_parent("tr")
-            if not header_row:
+            header_row = next(td.iterancestors("tr"), None)
+            if header_row is None:
                 continue
-            data_row = header_row.find_next_sibling("tr")
-            if not data_row:
+            data_row = next(header_row.itersiblings("tr"), None)
+            if data_row is None:
                 continue
 
-            cells = data_row.find_all("td", class_="asmt_info")
+            cells = _iter_class(data_row, "td", "asmt_info")
             if len(cells) >= 2:
                 # First cell: price, second cell: date
-                price = _parse_price(cells[0].get_text())
-                date = _parse_date(cells[1].get_text())
+                price = _parse_price(cells[0].text_content())
+                date = _parse_date(cells[1].text_content())
                 if price and price > 0:
                     detail["last_sale_price"] = price
                     detail["last_sale_date"] = date
             return
 
 
-def _parse_market_values(soup: BeautifulSoup, detail: dict[str, Any]) -> None:
-    """Extract total RMV/AV from Market Value Summary table."""
+def _parse_market_values(
+    root: lxml_html.HtmlElement,
+    hd_ths: list[lxml_html.HtmlElement],
+    detail: dict[str, Any],
+) -> None:
+    """Extract total RMV/AV from Market Value Summary table.
+
+    hd_ths are the page's th.asmt_hd cells in document order.
+    """
     # Find the MarketTable by id or by header text
-    market_table = soup.find("table", id="MarketTable")
-    if not market_table:
+    market_table = next((t for t in root.iter("table") if t.get("id") == "MarketTable"),
+                        None)
+    if market_table is None:
         # Fallback: find by header text
-        for th in soup.find_all("th", class_="asmt_hd"):
-            if "market value summary" in _clean_text(th.get_text()).lower():
-                parent_tr = th.find_parent("tr")
-                if parent_tr:
-                    next_tr = parent_tr.find_next_sibling("tr")
-                    if next_tr:
-                        market_table = next_tr.find("table")
+        for th in hd_ths:
+            if "market value summary" in _clean_text(th.text_content()).lower():
+                parent_tr = next(th.iterancestors("tr"), None)
+                if parent_tr is not None:
+                    next_tr = next(parent_tr.itersiblings("tr"), None)
+                    if next_tr is not None:
+                        market_table = next(next_tr.iter("table"), None)
                 break
 
-    if not market_table:
+    if market_table is None:
         return
 
     # Find the "Total:" row
-    for row in market_table.find_all("tr"):
-        cells = row.find_all("td")
-        cell_texts = [_clean_text(c.get_text()) for c in cells]
+    for row in market_table.iter("tr"):
+        cells = list(row.iter("td"))
+        cell_texts = [_clean_text(c.text_content()) for c in cells]
         if any("total" in t.lower() for t in cell_texts):
             # Parse RMV, M5, MAV, AV from the total row
             # Layout: [PSO link, "Total:", RMV, M5, MAV, AV]
             values = []
-            for c in cells:
-                text = _clean_text(c.get_text())
+            for text in cell_texts:
                 val = _parse_price(text)
                 if val is not None and val >= 0:
                     values.append(val)
@@ -382,10 +512,11 @@ def _parse_market_values(soup: BeautifulSoup, detail: dict[str, Any]) -> None:
             return
 
 
-def _parse_improvements_asmt(soup: BeautifulSoup) -> list[dict[str, Any]]:
+def _parse_improvements_asmt(hd_ths: list[lxml_html.HtmlElement]) -> list[dict[str, Any]]:
     """Parse improvements from the Ora_asmt_details.cfm Improvements section.
 
-    The table has columns:
+    hd_ths are the page's th.asmt_hd cells in document order. The table has
+    columns:
     Building # | Code Area | Year Built | Eff Year | Stat Class |
     Description | Type | SqFt | % Complete
     """
@@ -393,28 +524,28 @@ def _parse_improvements_asmt(soup: BeautifulSoup) -> list[dict[str, Any]]:
 
     # Find the "Improvements" header
     impr_header = None
-    for th in soup.find_all("th", class_="asmt_hd"):
-        text = _clean_text(th.get_text())
+    for th in hd_ths:
+        text = _clean_text(th.text_content())
         if text.lower() == "improvements":
             impr_header = th
             break
 
-    if not impr_header:
+    if impr_header is None:
         return improvements
 
     # Find the header row with "Building #"
-    parent = impr_header.find_parent("table")
-    if not parent:
+    parent = next(impr_header.iterancestors("table"), None)
+    if parent is None:
         return improvements
 
     # Look for the column headers row
     header_row = None
     col_indices: dict[str, int] = {}
-    for row in parent.find_all("tr"):
-        cells = row.find_all("td", class_="asmt_hd")
+    for row in parent.iter("tr"):
+        cells = _iter_class(row, "td", "asmt_hd")
         if not cells:
             continue
-        texts = [_clean_text(c.get_text()).lower() for c in cells]
+        texts = [_clean_text(c.text_content()).lower() for c in cells]
         if any("building" in t for t in texts) and any("sqft" in t for t in texts):
             header_row = row
             for i, t in enumerate(texts):
@@ -434,20 +565,20 @@ def _parse_improvements_asmt(soup: BeautifulSoup) -> list[dict[str, Any]]:
                     col_indices["stat_class"] = i
             break
 
-    if not header_row or not col_indices:
+    if header_row is None or not col_indices:
         return improvements
 
     # Parse data rows after the header
-    for row in header_row.find_next_siblings("tr"):
-        cells = row.find_all("td", class_="asmt_info")
+    for row in header_row.itersiblings("tr"):
+        cells = _iter_class(row, "td", "asmt_info")
         if not cells:
             # Stop at next header/section
-            if row.find("th"):
+            if next(row.iter("th"), None) is not None:
                 break
             continue
 
-        texts = [_clean_text(c.get_text()) for c in cells]
-        if not texts or all(not t for t in texts):
+        texts = [_clean_text(c.text_content()) for c in cells]
+        if not any(texts):
             continue
 
         impr: dict[str, Any] = {}
@@ -491,16 +622,16 @@ def parse_permits(html: str) -> list[dict[str, Any]]:
     Extracts:
     - permit number, type, date, status, description
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = _parse_html(html)
     permits: list[dict[str, Any]] = []
 
-    for table in soup.find_all("table"):
-        rows = table.find_all("tr")
+    for table in root.iter("table"):
+        rows = list(table.iter("tr"))
         if len(rows) < 2:
             continue
 
-        headers = [_clean_text(th.get_text()).lower()
-                    for th in rows[0].find_all(["th", "td"])]
+        headers = [_clean_text(th.text_content()).lower()
+                    for th in rows[0].iter("th", "td")]
 
         is_permit = any(
             keyword in " ".join(headers)
@@ -509,18 +640,11 @@ def parse_permits(html: str) -> list[dict[str, Any]]:
         if not is_permit:
             continue
 
-        col_map = _map_columns(headers, {
-            "number": ["permit", "number", "permit no", "permit number",
-                        "application", "app"],
-            "type": ["type", "permit type", "work type", "description"],
-            "date": ["date", "issue date", "issued", "applied", "app date"],
-            "status": ["status", "state", "disposition"],
-            "description": ["description", "desc", "work description", "scope"],
-        })
+        col_map = _map_columns(headers, _PERMIT_COLUMNS)
 
         for row in rows[1:]:
-            cells = [_clean_text(td.get_text()) for td in row.find_all("td")]
-            if not cells or all(not c for c in cells):
+            cells = [_clean_text(td.text_content()) for td in row.iter("td")]
+            if not any(cells):
                 continue
 
             permit: dict[str, Any] = {}
@@ -546,31 +670,67 @@ def parse_permits(html: str) -> list[dict[str, Any]]:
 
 # ── Utilities ──────────────────────────────────────────────────────────────
 
-def _map_columns(headers: list[str], mappings: dict[str, list[str]]) -> dict[str, int]:
+def _column_keywords(mappings: dict[str, list[str]]) -> tuple[tuple[str, str], ...]:
+    """Flatten {field_name: [possible_header_texts]} into (keyword, field) pairs."""
+    return tuple((kw, field) for field, keywords in mappings.items() for kw in keywords)
+
+
+def _map_columns(headers: list[str], keywords: tuple[tuple[str, str], ...]) -> dict[str, int]:
     """
     Map logical field names to column indices based on header text matching.
 
+    Each field maps to the first header containing any of its keywords; one
+    header may serve several fields.
+
     Args:
         headers: List of lowercase header strings
-        mappings: Dict of {field_name: [possible_header_texts]}
+        keywords: (keyword, field_name) pairs from _column_keywords
 
     Returns:
         Dict of {field_name: column_index}
     """
     col_map: dict[str, int] = {}
+    field_count = len({field for _, field in keywords})
 
-    for field, keywords in mappings.items():
-        for i, header in enumerate(headers):
-            for kw in keywords:
-                if kw in header:
-                    col_map[field] = i
-                    break
-            if field in col_map:
-                break
+    for i, header in enumerate(headers):
+        for kw, field in keywords:
+            if field not in col_map and kw in header:
+                col_map[field] = i
+        if len(col_map) == field_count:
+            break
 
     return col_map
 
 
+# Header keywords per logical field for each table _map_columns is used on
+_SALES_COLUMNS = _column_keywords({
+    "book_page": ["book - page", "book-page", "book page"],
+    "date": ["sale date"],
+    "price": ["sale price"],
+    "grantee": ["grantee"],
+    "grantor": ["grantor"],
+    "doc_type": ["document type"],
+})
+
+_JV_COLUMNS = _column_keywords({
+    "date": ["journal voucher date", "sale date"],
+    "sale_date": ["sale date"],
+    "price": ["sale $", "sale"],
+    "owner": ["fee owner"],
+    "instrument": ["instrument type"],
+    "maptaxlot": ["map taxlot"],
+})
+
+_PERMIT_COLUMNS = _column_keywords({
+    "number": ["permit", "number", "permit no", "permit number",
+               "application", "app"],
+    "type": ["type", "permit type", "work type", "description"],
+    "date": ["date", "issue date", "issued", "applied", "app date"],
+    "status": ["status", "state", "disposition"],
+    "description": ["description", "desc", "work description", "scope"],
+})
+
+
 def parse_account(
     sales_html: str | None,
     detail_html: str | None,
@@ -7,38 +7,42 @@ Fetches and caches raw HTML from three page types:
 - Permit history:   /pdo/permit.cfm?account={ACCOUNT_ID}
 
 Features:
-- Rate limiting (configurable delay between requests)
+- Rate limiting (one request per REQUEST_DELAY_SEC across all threads)
 - Raw HTML caching (don't re-fetch what we already have)
 - Resume capability (skip already-cached accounts)
-- Retry with exponential backoff on failures
+- Retry with exponential backoff on failures (see http_session.make_session)
+- Conditional re-fetches (If-None-Match / If-Modified-Since) when forced
 """
 
 import hashlib
+import json
 import logging
-import time
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 
 from config import (
     CACHE_DIR,
-    MAX_RETRIES,
     PDO_BASE,
     REQUEST_DELAY_SEC,
     REQUEST_TIMEOUT_SEC,
-    RETRY_BACKOFF_SEC,
-    USER_AGENT,
+    SCRAPE_WORKERS,
 )
+from http_session import RateLimiter, make_session
 
 logger = logging.getLogger(__name__)
 
-SESSION = requests.Session()
-SESSION.headers.update({
-    "User-Agent": USER_AGENT,
+SESSION = make_session({
     "Accept": "text/html,application/xhtml+xml",
     "Accept-Language": "en-US,en;q=0.9",
 })
 
+# Every PDO request from every thread waits its turn here, so concurrent
+# workers together stay at one request per REQUEST_DELAY_SEC
+PDO_LIMITER = RateLimiter(REQUEST_DELAY_SEC)
+
 # Page types and their URL templates
 PAGE_TYPES = {
     "sales": f"{PDO_BASE}/sales.cfm",
@@ -47,35 +51,89 @@ PAGE_TYPES = {
 }
 
 
+def safe_account(account: str) -> str:
+    """Sanitize an account ID for use as a cache filename stem."""
+    return account.replace("-", "").replace(" ", "")
+
+
 def _cache_path(account: str, page_type: str) -> Path:
-    """Return the cache file path for a given account and page type."""
-    subdir = CACHE_DIR / page_type
-    subdir.mkdir(parents=True, exist_ok=True)
-    # Sanitize account ID for filename
-    safe_account = account.replace("-", "").replace(" ", "")
-    return subdir / f"{safe_account}.html"
+    """Return the cache file path for a given account and page type.
+
+    The page type's directory is only created when a page is saved.
+    """
+    return CACHE_DIR / page_type / f"{safe_account(account)}.html"
 
 
 def is_cached(account: str, page_type: str) -> bool:
-    """Check if a page is already cached."""
-    path = _cache_path(account, page_type)
-    return path.exists() and path.stat().st_size > 0
+    """Check if a page is already cached (one stat call)."""
+    try:
+        return _cache_path(account, page_type).stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def cached_accounts(page_type: str) -> set[str]:
+    """Return the sanitized account IDs with a non-empty cached page of a type.
+
+    One directory scan stands in for an is_cached() call per account; test
+    membership with the safe_account() form of the account ID.
+    """
+    try:
+        with os.scandir(CACHE_DIR / page_type) as entries:
+            return {
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith(".html") and entry.stat().st_size > 0
+            }
+    except FileNotFoundError:
+        return set()
 
 
 def read_cached(account: str, page_type: str) -> str | None:
     """Read cached HTML for an account/page_type. Returns None if not cached."""
-    path = _cache_path(account, page_type)
-    if path.exists() and path.stat().st_size > 0:
-        return path.read_text(encoding="utf-8", errors="replace")
-    return None
+    try:
+        html = _cache_path(account, page_type).read_text(encoding="utf-8", errors="replace")
+    except FileNotFoundError:
+        return None
+    return html or None
 
 
 def _save_cache(account: str, page_type: str, html: str) -> None:
     """Save raw HTML to cache."""
     path = _cache_path(account, page_type)
+    path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(html, encoding="utf-8")
 
 
+def _validators_path(account: str, page_type: str) -> Path:
+    """Return the sidecar file holding a cached page's ETag/Last-Modified."""
+    return _cache_path(account, page_type).with_suffix(".meta.json")
+
+
+def _conditional_headers(account: str, page_type: str) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers for a cached page."""
+    try:
+        validators = json.loads(_validators_path(account, page_type).read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    headers: dict[str, str] = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _save_validators(account: str, page_type: str, resp: requests.Response) -> None:
+    """Store a response's ETag/Last-Modified next to its cached page, if it sent any."""
+    path = _validators_path(account, page_type)
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        path.write_text(json.dumps({"etag": etag, "last_modified": last_modified}))
+    else:
+        path.unlink(missing_ok=True)
+
+
 def fetch_page(
     account: str,
     page_type: str,
@@ -85,10 +143,14 @@ def fetch_page(
     """
     Fetch a PDO page for the given account or maptaxlot.
 
+    Network requests are paced by PDO_LIMITER; cache hits return at once.
+
     Args:
         account: The property account ID (e.g. "10059095" or "1-005909-5")
         page_type: One of "sales", "detail", "permit"
-        force: If True, fetch even if cached
+        force: If True, fetch even if cached. A cached page whose response
+            carried an ETag or Last-Modified is revalidated with a
+            conditional GET, and kept as is on 304 Not Modified.
         maptaxlot: Optional maptaxlot to use instead of account for lookup
 
     Returns:
@@ -118,46 +180,45 @@ def fetch_page(
     else:
         return None
 
-    for attempt in range(MAX_RETRIES):
-        try:
-            resp = SESSION.get(url, params=params, timeout=REQUEST_TIMEOUT_SEC)
-            resp.raise_for_status()
-
-            html = resp.text
-
-            # Basic validation — check we got actual content
-            if len(html) < 200:
-                logger.warning(
-                    "Suspiciously short response for %s/%s (%d bytes)",
-                    page_type, account, len(html),
-                )
-
-            # Cache the response
-            _save_cache(cache_key, page_type, html)
-            logger.info("Fetched and cached: %s/%s (%d bytes)", page_type, cache_key, len(html))
-            return html
-
-        except requests.HTTPError as exc:
-            if exc.response is not None and exc.response.status_code == 404:
-                logger.warning("404 for %s/%s — account may not exist", page_type, cache_key)
-                return None
-            wait = RETRY_BACKOFF_SEC * (2 ** attempt)
-            logger.warning(
-                "HTTP error for %s/%s (attempt %d/%d): %s — retrying in %.1fs",
-                page_type, account, attempt + 1, MAX_RETRIES, exc, wait,
-            )
-            time.sleep(wait)
-
-        except requests.RequestException as exc:
-            wait = RETRY_BACKOFF_SEC * (2 ** attempt)
-            logger.warning(
-                "Request error for %s/%s (attempt %d/%d): %s — retrying in %.1fs",
-                page_type, account, attempt + 1, MAX_RETRIES, exc, wait,
-            )
-            time.sleep(wait)
-
-    logger.error("All attempts failed for %s/%s", page_type, account)
-    return None
+    # A cache file is only present here on a forced re-fetch
+    headers: dict[str, str] = {}
+    if is_cached(cache_key, page_type):
+        headers = _conditional_headers(cache_key, page_type)
+
+    # Connection errors, 429s and 5xx responses are retried by the session adapter
+    PDO_LIMITER.wait()
+    try:
+        resp = SESSION.get(url, params=params, headers=headers, timeout=REQUEST_TIMEOUT_SEC)
+        resp.raise_for_status()
+    except requests.HTTPError as exc:
+        if exc.response is not None and exc.response.status_code == 404:
+            logger.warning("404 for %s/%s — account may not exist", page_type, cache_key)
+        else:
+            logger.error("HTTP error for %s/%s: %s", page_type, account, exc)
+        return None
+    except requests.RequestException as exc:
+        logger.error("All attempts failed for %s/%s: %s", page_type, account, exc)
+        return None
+
+    if resp.status_code == 304:
+        logger.debug("Not modified: %s/%s", page_type, cache_key)
+        _cache_path(cache_key, page_type).touch()
+        return read_cached(cache_key, page_type)
+
+    html = resp.text
+
+    # Basic validation — check we got actual content
+    if len(html) < 200:
+        logger.warning(
+            "Suspiciously short response for %s/%s (%d bytes)",
+            page_type, account, len(html),
+        )
+
+    # Cache the response
+    _save_cache(cache_key, page_type, html)
+    _save_validators(cache_key, page_type, resp)
+    logger.info("Fetched and cached: %s/%s (%d bytes)", page_type, cache_key, len(html))
+    return html
 
 
 def fetch_all_pages(account: str, force: bool = False) -> dict[str, str | None]:
@@ -165,7 +226,7 @@ def fetch_all_pages(account: str, force: bool = False) -> dict[str, str | None]:
     Fetch all three page types for an account.
 
     Returns dict mapping page_type -> HTML (or None on failure).
-    Respects rate limiting between requests.
+    Network requests are rate limited by fetch_page.
     """
     results: dict[str, str | None] = {}
 
@@ -176,8 +237,6 @@ def fetch_all_pages(account: str, force: bool = False) -> dict[str, str | None]:
             continue
 
         results[page_type] = fetch_page(account, page_type, force=force)
-        # Rate limit between actual network requests
-        time.sleep(REQUEST_DELAY_SEC)
 
     return results
 
@@ -187,29 +246,31 @@ def scrape_accounts(
     page_types: list[str] | None = None,
     force: bool = False,
     progress_callback: callable = None,
+    workers: int = SCRAPE_WORKERS,
 ) -> dict[str, dict[str, str | None]]:
     """
     Scrape PDO pages for a list of accounts.
 
+    Accounts are fetched on a pool of worker threads. Network requests from
+    all of them share fetch_page's rate limit, so more workers only overlap
+    slow responses. Cache hits are not delayed.
+
     Args:
         accounts: List of account IDs to scrape
         page_types: Which page types to fetch (default: all three)
         force: Re-fetch even if cached
-        progress_callback: Called with (current_index, total, account) for progress
+        progress_callback: Called with (current_index, total, account) on
+            the caller's thread, in account order, once that account's
+            pages are in
+        workers: Number of accounts fetched concurrently
 
     Returns:
-        Dict mapping account -> {page_type: HTML}
+        Dict mapping account -> {page_type: HTML}, in account order
     """
     if page_types is None:
         page_types = list(PAGE_TYPES)
 
-    results: dict[str, dict[str, str | None]] = {}
-    total = len(accounts)
-
-    for i, account in enumerate(accounts):
-        if progress_callback:
-            progress_callback(i, total, account)
-
+    def scrape_account(account: str) -> dict[str, str | None]:
         account_results: dict[str, str | None] = {}
         for page_type in page_types:
             if not force and is_cached(account, page_type):
@@ -217,9 +278,20 @@ def scrape_accounts(
                 continue
 
             account_results[page_type] = fetch_page(account, page_type, force=force)
-            time.sleep(REQUEST_DELAY_SEC)
+        return account_results
+
+    results: dict[str, dict[str, str | None]] = {}
+    total = len(accounts)
 
-        results[account] = account_results
+    # pool.map yields in input order, so the callback runs here rather than
+    # on the worker threads
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for i, (account, account_results) in enumerate(
+            zip(accounts, pool.map(scrape_account, accounts))
+        ):
+            if progress_callback:
+                progress_callback(i, total, account)
+            results[account] = account_results
 
     return results
 
@@ -230,10 +302,13 @@ def get_scrape_progress(accounts: list[str]) -> dict[str, dict[str, bool]]:
 
     Returns dict mapping account -> {page_type: is_cached}
     """
+    # One directory scan per page type instead of a stat per account and type
+    cached = {pt: cached_accounts(pt) for pt in PAGE_TYPES}
     progress: dict[str, dict[str, bool]] = {}
     for account in accounts:
+        safe_acct = safe_account(account)
         progress[account] = {
-            pt: is_cached(account, pt)
+            pt: safe_acct in cached[pt]
             for pt in PAGE_TYPES
         }
     return progress
@@ -13,8 +13,11 @@ Usage:
   python data/validate.py --fix     # run all checks and fix what we can
 """
 
+import heapq
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Any
@@ -24,6 +27,11 @@ PARCELS_JSON = DATA_DIR / "parcels.json"
 SALES_DIR = DATA_DIR / "sales"
 AGGREGATES_DIR = DATA_DIR / "aggregates"
 
+# Below this many sales files, starting worker processes costs more than it saves
+PARALLEL_MIN_SALES_FILES = 200
+# Threads reading sales files when they are validated in this process
+SALES_READ_WORKERS = 32
+
 # ── Schema definitions (from CLAUDE.md data contract) ─────────────────────
 
 PARCEL_REQUIRED_FIELDS = {
@@ -70,6 +78,8 @@ IMPROVEMENT_FIELDS = {
 # ── Validation helpers ─────────────────────────────────────────────────────
 
 class ValidationResult:
+    __slots__ = ("errors", "warnings", "info")
+
     def __init__(self) -> None:
         self.errors: list[str] = []
         self.warnings: list[str] = []
@@ -118,37 +128,68 @@ class ValidationResult:
             print("\n  RESULT: PASS\n")
 
 
-def check_fields(obj: dict, fields: dict[str, Any], label: str, result: ValidationResult) -> None:
-    """Check that obj has the expected fields with correct types."""
+FieldSchema = tuple[tuple[str, tuple[type, ...], str, bool], ...]
+
+
+def compile_fields(fields: dict[str, Any]) -> FieldSchema:
+    """Precompute a field schema for check_fields.
+
+    Each entry is (field, accepted types, expected-type text for messages,
+    nullable), so checking an object does no per-call tuple or name building.
+    """
+    compiled = []
     for field, expected_type in fields.items():
+        if isinstance(expected_type, tuple):
+            expected = f"one of {[t.__name__ for t in expected_type]}"
+            nullable = type(None) in expected_type
+            compiled.append((field, expected_type, expected, nullable))
+        else:
+            compiled.append((field, (expected_type,), expected_type.__name__, False))
+    return tuple(compiled)
+
+
+PARCEL_REQUIRED_SCHEMA = compile_fields(PARCEL_REQUIRED_FIELDS)
+PARCEL_NULLABLE_SCHEMA = compile_fields(PARCEL_NULLABLE_FIELDS)
+SALE_SCHEMA = compile_fields(SALE_FIELDS)
+PERMIT_SCHEMA = compile_fields(PERMIT_FIELDS)
+IMPROVEMENT_SCHEMA = compile_fields(IMPROVEMENT_FIELDS)
+
+
+def check_fields(obj: dict, schema: FieldSchema, label: str, result: ValidationResult) -> None:
+    """Check that obj has the expected fields with correct types.
+
+    schema comes from compile_fields().
+    """
+    error = result.errors.append
+    for field, types, expected, nullable in schema:
         if field not in obj:
-            result.error(f"{label}: missing field '{field}'")
+            error(f"{label}: missing field '{field}'")
             continue
         value = obj[field]
-        if isinstance(expected_type, tuple):
-            if not isinstance(value, expected_type):
-                result.error(
-                    f"{label}: field '{field}' has type {type(value).__name__}, "
-                    f"expected one of {[t.__name__ for t in expected_type]}"
-                )
-        else:
-            if not isinstance(value, expected_type):
-                result.error(
-                    f"{label}: field '{field}' has type {type(value).__name__}, "
-                    f"expected {expected_type.__name__}"
-                )
+        # None is the common value for nullable fields; skip the type walk
+        if nullable and value is None:
+            continue
+        if not isinstance(value, types):
+            error(
+                f"{label}: field '{field}' has type {type(value).__name__}, "
+                f"expected {expected}"
+            )
 
 
 # ── Main validation routines ──────────────────────────────────────────────
 
-def validate_parcels(result: ValidationResult) -> dict | None:
-    """Validate parcels.json structure and data quality."""
-    if not PARCELS_JSON.exists():
-        result.error("parcels.json does not exist")
-        return None
+def validate_parcels(result: ValidationResult, data: dict | None = None) -> dict | None:
+    """Validate parcels.json structure and data quality.
+
+    Pass data to check an already-loaded parcels document instead of
+    reading parcels.json.
+    """
+    if data is None:
+        if not PARCELS_JSON.exists():
+            result.error("parcels.json does not exist")
+            return None
 
-    with open(PARCELS_JSON) as f:
-        data = json.load(f)
+        data = json.loads(PARCELS_JSON.read_bytes())
 
     # Top-level structure
     if "generated" not in data:
@@ -171,13 +212,14 @@ def validate_parcels(result: ValidationResult) -> dict | None:
     null_metric_count = 0
     coords_out_of_range = 0
     missing_maptaxlot = 0
+    warn = result.warnings.append
 
     for i, parcel in enumerate(parcels):
         label = f"parcel[{i}]"
 
         # Check required fields
-        check_fields(parcel, PARCEL_REQUIRED_FIELDS, label, result)
-        check_fields(parcel, PARCEL_NULLABLE_FIELDS, label, result)
+        check_fields(parcel, PARCEL_REQUIRED_SCHEMA, label, result)
+        check_fields(parcel, PARCEL_NULLABLE_SCHEMA, label, result)
 
         # Coordinate sanity (Ashland OR is approximately 42.19N, 122.71W)
         lat = parcel.get("lat")
@@ -192,15 +234,16 @@ def validate_parcels(result: ValidationResult) -> dict | None:
         acct = parcel.get("account", "")
         if acct:
             if acct in accounts_seen:
-                result.warn(f"parcel[{i}]: duplicate account '{acct}'")
-            accounts_seen.add(acct)
+                warn(f"parcel[{i}]: duplicate account '{acct}'")
+            else:
+                accounts_seen.add(acct)
 
         # Check if this parcel has any populated metric fields
-        has_data = any(
-            parcel.get(f) is not None
-            for f in ["sqft_living", "last_sale_price", "price_per_sqft"]
-        )
-        if has_data:
+        if (
+            parcel.get("sqft_living") is not None
+            or parcel.get("last_sale_price") is not None
+            or parcel.get("price_per_sqft") is not None
+        ):
             populated_count += 1
         else:
             null_metric_count += 1
@@ -233,65 +276,129 @@ def validate_parcels(result: ValidationResult) -> dict | None:
     return data
 
 
-def validate_sales(result: ValidationResult) -> list[str]:
-    """Validate sales/*.json files."""
+def _json_files(directory: Path) -> list[str]:
+    """Return the paths of the *.json files in a directory, sorted by name.
+
+    One os.scandir() pass; entries are plain strings rather than Path objects.
+    """
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        )
+
+
+def _read_bytes(path: str) -> bytes:
+    """Return a file's contents (takes plain string paths from _json_files)."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _validate_one_sales_file(
+    sf: str, raw: bytes | None = None,
+) -> tuple[list[str], list[str], list[str], str | None]:
+    """Validate one sales/*.json file.
+
+    Top-level so it can run in a worker process. raw is the file's contents
+    if the caller has already read them. Returns the file's
+    (errors, warnings, info, account_id); account_id is None when the file
+    has no 'account' field or could not be parsed.
+    """
+    result = ValidationResult()
+    name = os.path.basename(sf)
+    label = f"sales/{name}"
+    try:
+        data = json.loads(raw if raw is not None else _read_bytes(sf))
+    except json.JSONDecodeError:
+        result.error(f"{label}: invalid JSON")
+        return result.errors, result.warnings, result.info, None
+
+    # Check top-level fields
+    account_id = None
+    if "account" not in data:
+        result.error(f"{label}: missing 'account' field")
+    else:
+        expected_acct = name[:-5]
+        if data["account"] != expected_acct:
+            result.error(
+                f"{label}: account field '{data['account']}' != filename '{expected_acct}'"
+            )
+        account_id = data["account"]
+
+    # Validate sales array
+    if "sales" not in data:
+        result.error(f"{label}: missing 'sales' array")
+    elif not isinstance(data["sales"], list):
+        result.error(f"{label}: 'sales' is not an array")
+    else:
+        for j, sale in enumerate(data["sales"]):
+            check_fields(sale, SALE_SCHEMA, f"{label}.sales[{j}]", result)
+
+    # Validate permits array
+    if "permits" not in data:
+        result.error(f"{label}: missing 'permits' array")
+    elif not isinstance(data["permits"], list):
+        result.error(f"{label}: 'permits' is not an array")
+    else:
+        for j, permit in enumerate(data["permits"]):
+            check_fields(permit, PERMIT_SCHEMA, f"{label}.permits[{j}]", result)
+
+    # Validate improvements array
+    if "improvements" not in data:
+        result.error(f"{label}: missing 'improvements' array")
+    elif not isinstance(data["improvements"], list):
+        result.error(f"{label}: 'improvements' is not an array")
+    else:
+        for j, imp in enumerate(data["improvements"]):
+            check_fields(imp, IMPROVEMENT_SCHEMA, f"{label}.improvements[{j}]", result)
+
+    return result.errors, result.warnings, result.info, account_id
+
+
+def validate_sales(result: ValidationResult) -> tuple[list[str], set[str]]:
+    """Validate sales/*.json files.
+
+    Returns the account IDs found in the files, and the set of accounts
+    whose sales/<account>.json parsed and names that same account.
+
+    Past PARALLEL_MIN_SALES_FILES files on a multi-core machine, they are
+    validated in worker processes; otherwise they are validated here while a
+    thread pool reads ahead. Messages are reported in filename order either
+    way.
+    """
     if not SALES_DIR.exists():
         result.error("sales/ directory does not exist")
-        return []
+        return [], set()
 
-    sales_files = sorted(SALES_DIR.glob("*.json"))
+    # Sorted so messages come out in filename order
+    sales_files = _json_files(SALES_DIR)
     result.add_info(f"sales/: {len(sales_files)} files found")
 
     account_ids: list[str] = []
-
-    for sf in sales_files:
-        label = f"sales/{sf.name}"
-        with open(sf) as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                result.error(f"{label}: invalid JSON")
-                continue
-
-        # Check top-level fields
-        if "account" not in data:
-            result.error(f"{label}: missing 'account' field")
-        else:
-            expected_acct = sf.stem
-            if data["account"] != expected_acct:
-                result.error(
-                    f"{label}: account field '{data['account']}' != filename '{expected_acct}'"
-                )
-            account_ids.append(data["account"])
-
-        # Validate sales array
-        if "sales" not in data:
-            result.error(f"{label}: missing 'sales' array")
-        elif not isinstance(data["sales"], list):
-            result.error(f"{label}: 'sales' is not an array")
-        else:
-            for j, sale in enumerate(data["sales"]):
-                check_fields(sale, SALE_FIELDS, f"{label}.sales[{j}]", result)
-
-        # Validate permits array
-        if "permits" not in data:
-            result.error(f"{label}: missing 'permits' array")
-        elif not isinstance(data["permits"], list):
-            result.error(f"{label}: 'permits' is not an array")
-        else:
-            for j, permit in enumerate(data["permits"]):
-                check_fields(permit, PERMIT_FIELDS, f"{label}.permits[{j}]", result)
-
-        # Validate improvements array
-        if "improvements" not in data:
-            result.error(f"{label}: missing 'improvements' array")
-        elif not isinstance(data["improvements"], list):
-            result.error(f"{label}: 'improvements' is not an array")
-        else:
-            for j, imp in enumerate(data["improvements"]):
-                check_fields(imp, IMPROVEMENT_FIELDS, f"{label}.improvements[{j}]", result)
-
-    return account_ids
+    file_accounts: set[str] = set()
+
+    if len(sales_files) > PARALLEL_MIN_SALES_FILES and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as pool:
+            per_file = list(pool.map(_validate_one_sales_file, sales_files, chunksize=64))
+    else:
+        # Read on a thread pool so file I/O overlaps the validation loop
+        read_workers = max(1, min(SALES_READ_WORKERS, len(sales_files)))
+        with ThreadPoolExecutor(max_workers=read_workers) as readers:
+            per_file = [
+                _validate_one_sales_file(sf, raw)
+                for sf, raw in zip(sales_files, readers.map(_read_bytes, sales_files))
+            ]
+
+    for sf, (errors, warnings, info, account_id) in zip(sales_files, per_file):
+        result.errors.extend(errors)
+        result.warnings.extend(warnings)
+        result.info.extend(info)
+        if account_id is not None:
+            account_ids.append(account_id)
+            if account_id == os.path.basename(sf)[:-5]:
+                file_accounts.add(account_id)
+
+    return account_ids, file_accounts
 
 
 def validate_aggregates(result: ValidationResult) -> None:
@@ -300,19 +407,16 @@ def validate_aggregates(result: ValidationResult) -> None:
         result.warn("aggregates/ directory does not exist")
         return
 
-    agg_files = sorted(AGGREGATES_DIR.glob("*.json"))
-    gitkeeps = [f for f in AGGREGATES_DIR.iterdir() if f.name == ".gitkeep"]
-    json_files = [f for f in agg_files]
+    json_files = _json_files(AGGREGATES_DIR)
     result.add_info(f"aggregates/: {len(json_files)} JSON files found")
 
     for af in json_files:
-        label = f"aggregates/{af.name}"
-        with open(af) as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                result.error(f"{label}: invalid JSON")
-                continue
+        label = f"aggregates/{os.path.basename(af)}"
+        try:
+            data = json.loads(_read_bytes(af))
+        except json.JSONDecodeError:
+            result.error(f"{label}: invalid JSON")
+            continue
 
         if "generated" not in data:
             result.warn(f"{label}: missing 'generated' field")
@@ -336,29 +440,34 @@ def validate_cross_references(
         result.error("cross-ref: can't check — parcels.json failed to load")
         return
 
-    parcel_accounts = {
-        p["account"] for p in parcels_data["parcels"] if p.get("account")
-    }
+    # One pass collects the linked accounts and counts the unlinked parcels
+    parcel_accounts: set[str] = set()
+    no_account_count = 0
+    for p in parcels_data["parcels"]:
+        acct = p.get("account")
+        if acct:
+            parcel_accounts.add(acct)
+        else:
+            no_account_count += 1
+
+    sales_set = set(sales_accounts)
 
     # Sales files with no matching parcel
-    orphan_sales = set(sales_accounts) - parcel_accounts
+    orphan_sales = sales_set - parcel_accounts
     if orphan_sales:
         result.error(
             f"cross-ref: {len(orphan_sales)} sales files have no matching parcel in parcels.json: "
-            f"{sorted(orphan_sales)[:10]}{'...' if len(orphan_sales) > 10 else ''}"
+            f"{heapq.nsmallest(10, orphan_sales)}{'...' if len(orphan_sales) > 10 else ''}"
         )
 
     # Parcels with accounts but no sales file
-    missing_sales = parcel_accounts - set(sales_accounts)
+    missing_sales = parcel_accounts - sales_set
     if missing_sales:
         result.warn(
             f"cross-ref: {len(missing_sales)} parcels have account numbers but no sales file"
         )
 
     # Parcels that can't load detail views (no account)
-    no_account_count = sum(
-        1 for p in parcels_data["parcels"] if not p.get("account")
-    )
     if no_account_count > 0:
         result.warn(
             f"cross-ref: {no_account_count}/{len(parcels_data['parcels'])} parcels have no account — "
@@ -368,12 +477,18 @@ def validate_cross_references(
 
 # ── Fix mode ──────────────────────────────────────────────────────────────
 
-def fix_parcels_from_sales(parcels_data: dict, sales_accounts: list[str]) -> int:
+def fix_parcels_from_sales(
+    parcels_data: dict,
+    sales_accounts: list[str],
+    file_accounts: set[str],
+) -> int:
     """
     Backfill parcels.json using data from sales/*.json files.
 
     For each sales file, find a parcel without an account number and assign
     the sales data to it. This connects the mock data to actual map coordinates.
+    file_accounts is the set returned by validate_sales; accounts outside it
+    have no usable sales/<account>.json and are skipped.
     """
     parcels = parcels_data["parcels"]
 
@@ -383,18 +498,18 @@ def fix_parcels_from_sales(parcels_data: dict, sales_accounts: list[str]) -> int
         print("  No unassigned parcels to fill.")
         return 0
 
+    existing = {p["account"] for p in parcels if p.get("account")}
+
     fixed = 0
     for account in sorted(sales_accounts):
         # Skip if this account already exists in a parcel
-        if any(p.get("account") == account for p in parcels):
+        if account in existing:
             continue
 
-        sales_path = SALES_DIR / f"{account}.json"
-        if not sales_path.exists():
+        if account not in file_accounts:
             continue
 
-        with open(sales_path) as f:
-            sales_data = json.load(f)
+        sales_data = json.loads((SALES_DIR / f"{account}.json").read_bytes())
 
         if not unassigned:
             break
@@ -405,6 +520,7 @@ def fix_parcels_from_sales(parcels_data: dict, sales_accounts: list[str]) -> int
 
         # Set account
         parcel["account"] = account
+        existing.add(account)
 
         # Generate an address from the account (placeholder)
         parcel["address"] = f"Parcel {account}"
@@ -422,14 +538,16 @@ def fix_parcels_from_sales(parcels_data: dict, sales_accounts: list[str]) -> int
             parcel["sqft_living"] = dwelling_sqft
 
         # year_built from improvements
-        years = [imp.get("year_built") for imp in improvements if imp.get("year_built")]
-        if years:
-            parcel["year_built"] = min(years)
+        earliest_year = min(
+            (year for imp in improvements if (year := imp.get("year_built"))),
+            default=None,
+        )
+        if earliest_year is not None:
+            parcel["year_built"] = earliest_year
 
         # last sale info
         if sales:
-            sorted_sales = sorted(sales, key=lambda s: s.get("date", ""), reverse=True)
-            latest = sorted_sales[0]
+            latest = max(sales, key=lambda s: s.get("date", ""))
             parcel["last_sale_price"] = latest.get("price")
             parcel["last_sale_date"] = latest.get("date")
 
@@ -480,7 +598,7 @@ def main() -> int:
 
     # 2. Validate sales files
     print("[2/4] Checking sales/*.json...")
-    sales_accounts = validate_sales(result)
+    sales_accounts, file_accounts = validate_sales(result)
 
     # 3. Validate aggregates
     print("[3/4] Checking aggregates/*.json...")
@@ -493,17 +611,16 @@ def main() -> int:
     # Fix mode
     if fix_mode and parcels_data:
         print("\n--- FIX MODE ---")
-        fixed = fix_parcels_from_sales(parcels_data, sales_accounts)
+        fixed = fix_parcels_from_sales(parcels_data, sales_accounts, file_accounts)
         if fixed > 0:
             print(f"  Backfilled {fixed} parcels with data from sales files.")
-            with open(PARCELS_JSON, "w") as f:
-                json.dump(parcels_data, f, indent=2)
+            PARCELS_JSON.write_text(json.dumps(parcels_data, indent=2))
             print(f"  Wrote updated parcels.json.")
 
             # Re-validate after fix
             print("\n  Re-validating after fix...")
             result2 = ValidationResult()
-            validate_parcels(result2)
+            validate_parcels(result2, data=parcels_data)
             validate_cross_references(
                 parcels_data,
                 sales_accounts,